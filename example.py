@@ -8,15 +8,66 @@ for integrating the media organizer into enterprise workflows.
 
 import os
 import sys
+import argparse
+import itertools
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Add src directory to path
 sys.path.append(str(Path(__file__).parent / 'src'))
 
+# AIOrganizer and FileOperations pull in google-genai, so they are imported
+# only when an example talks to the AI
+
 from tree_generator import TreeGenerator
-from ai_organizer import AIOrganizer
-from file_operations import FileOperations
+
+# Concurrent Gemini requests issued by the examples, and the model's RPM quota
+MAX_AI_WORKERS = 8
+GEMINI_REQUESTS_PER_MINUTE = 15
+
+
+# Display label and value format for analysis keys that need special handling
+_ANALYSIS_FMT = {
+    'total_size': ('Total Size', 'mb'),
+    'video_size': ('Video Size', 'mb'),
+}
+
+# Trees already scanned in this session, keyed by (root, folder, max_depth)
+_TREE_CACHE = {}
+
+# AIOrganizer shared by every example, created on first use
+_ORGANIZER = None
+
+
+@functools.lru_cache(maxsize=1)
+def _config():
+    """Load .env once per process and return the settings the examples use."""
+    load_dotenv()
+    return {'api_key': os.getenv('GEMINI_API_KEY')}
+
+
+def _get_organizer():
+    """Return the shared AIOrganizer, creating it on first use."""
+    global _ORGANIZER
+    if _ORGANIZER is None:
+        from ai_organizer import AIOrganizer
+        _ORGANIZER = AIOrganizer(_config()['api_key'], requests_per_minute=GEMINI_REQUESTS_PER_MINUTE)
+    return _ORGANIZER
+
+
+def _get_tree(generator, max_depth, folder_name=None):
+    """Return the scanned tree for a root (or one folder in it), scanning only on first use."""
+    key = (str(generator.root_path), folder_name, max_depth)
+    tree = _TREE_CACHE.get(key)
+    if tree is None:
+        if folder_name is None:
+            tree = generator.generate_tree(max_depth=max_depth)
+        else:
+            tree = generator.generate_single_folder_tree(folder_name, max_depth=max_depth)
+        _TREE_CACHE[key] = tree
+    return tree
 
 
 def example_scan_directory():
@@ -28,18 +79,22 @@ def example_scan_directory():
     # Replace with your actual path
     media_path = "/path/to/your/media"  # Change this!
 
-    if not Path(media_path).exists():
+    # Create tree generator, reusing the listing that proves the path exists
+    try:
+        with os.scandir(media_path) as entries:
+            generator = TreeGenerator.from_scandir(entries, media_path)
+    except (FileNotFoundError, NotADirectoryError):
         print(f"⚠️  Path doesn't exist: {media_path}")
         print("Please update the media_path variable in this script")
         return
+    except OSError as e:
+        print(f"Error: {e}")
+        return
 
     try:
-        # Create tree generator
-        generator = TreeGenerator(media_path)
-
         # Generate tree structure
         print("Scanning directory structure...")
-        tree = generator.generate_tree(max_depth=3)
+        tree = _get_tree(generator, max_depth=3)
 
         # Display tree
         print("\nDirectory Tree:")
@@ -52,11 +107,11 @@ def example_scan_directory():
         analysis = generator.analyze_media_content(tree)
 
         for key, value in analysis.items():
-            if key in ['total_size', 'video_size']:
-                size_mb = value / (1024 * 1024)
-                print(f"{key.replace('_', ' ').title()}: {size_mb:.1f} MB")
+            label, kind = _ANALYSIS_FMT.get(key) or (key.replace('_', ' ').title(), 'raw')
+            if kind == 'mb':
+                print(f"{label}: {value / (1024 * 1024):.1f} MB")
             else:
-                print(f"{key.replace('_', ' ').title()}: {value}")
+                print(f"{label}: {value}")
 
         # List available folders
         print("\nAvailable Folders:")
@@ -72,15 +127,53 @@ def example_scan_directory():
         print(f"Error: {e}")
 
 
+def _print_tv_show_plan(plan, file_ops):
+    """Display a TV show organization plan and its dry-run preview."""
+    print("\nAI Organization Plan:")
+    print("-" * 40)
+    print(f"  Show: {plan.show_name}")
+    if plan.year:
+        print(f"  Year: {plan.year}")
+    print(f"  Summary: {plan.summary}")
+    print("  Note: Original filenames are preserved during organization")
+
+    if plan.warnings:
+        print("\nWarnings:")
+        for warning in plan.warnings:
+            print(f"  ⚠️  {warning}")
+
+    # Build the whole listing first and write it once
+    lines = [f"\nSuggested Operations ({len(plan.suggestions)}):"]
+    for i, suggestion in enumerate(plan.suggestions, 1):
+        lines.append(f"{i:2d}. {suggestion.operation.upper()}")
+        if suggestion.operation == 'create_directory':
+            lines.append(f"    Create: {suggestion.destination_path}")
+        elif suggestion.operation == 'move':
+            lines.extend([
+                f"    Move: {suggestion.source_path}",
+                f"      To: {suggestion.destination_path}",
+                f"    Confidence: {suggestion.confidence:.1%}",
+                f"    (Filename preserved: {os.path.basename(suggestion.source_path)})",
+            ])
+        lines.append(f"    Reason: {suggestion.reason}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    # Preview execution (dry run)
+    print("\nExecution Preview:")
+    print("-" * 40)
+    preview = file_ops.preview_plan(plan)
+    print(preview)
+
+
 def example_tv_show_organization():
-    """Production example: Organize a TV show using AI."""
+    """Production example: Organize TV shows using AI, several shows per request."""
+    from file_operations import FileOperations
+
     print("\n" + "=" * 60)
     print("PRODUCTION EXAMPLE: TV Show Organization")
     print("=" * 60)
 
-    # Load environment variables
-    load_dotenv()
-    api_key = os.getenv('GEMINI_API_KEY')
+    api_key = _config()['api_key']
 
     if not api_key:
         print("⚠️  GEMINI_API_KEY not found in environment")
@@ -89,68 +182,64 @@ def example_tv_show_organization():
 
     # Example show structure (replace with real path)
     show_path = "/path/to/tv/shows"  # Change this!
-    show_name = "Silicon Valley"     # Change this!
+    show_names = ["Silicon Valley"]  # Change this! Leave empty to organize every show
 
-    if not Path(show_path).exists():
+    try:
+        with os.scandir(show_path) as entries:
+            generator = TreeGenerator.from_scandir(entries, show_path)
+    except (FileNotFoundError, NotADirectoryError):
         print(f"⚠️  Path doesn't exist: {show_path}")
         print("Please update the show_path variable in this script")
         return
+    except OSError as e:
+        print(f"Error: {e}")
+        return
 
     try:
         # Initialize components
-        generator = TreeGenerator(show_path)
-        organizer = AIOrganizer(api_key)
+        organizer = _get_organizer()
         file_ops = FileOperations(show_path, dry_run=True)  # Always dry run in example
 
-        # Generate tree for specific show
-        print(f"Analyzing show: {show_name}")
-        show_tree = generator.generate_single_folder_tree(show_name)
+        folders = generator.get_folder_list()
+        pending = iter(show_names or folders)
 
-        if not show_tree:
-            print(f"❌ Show folder not found: {show_name}")
-            return
+        # Group shows into small batches to save round-trips
+        batches = []
+        while True:
+            chunk = list(itertools.islice(pending, organizer.BATCH_SIZE))
+            if not chunk:
+                break
 
-        # Convert to text format
-        tree_text = generator.tree_to_text(show_tree)
-        print("\nCurrent Structure:")
-        print("-" * 40)
-        print(tree_text)
+            batch = []
+            for show_name in chunk:
+                if show_name not in folders:
+                    print(f"❌ Show folder not found: {show_name}")
+                    continue
 
-        # Get AI organization suggestions
-        print("\nGetting AI suggestions...")
-        plan = organizer.organize_tv_show(tree_text, show_name)
+                # Generate tree for specific show
+                print(f"Analyzing show: {show_name}")
+                show_tree = _get_tree(generator, max_depth=3, folder_name=show_name)
 
-        # Display organization plan
-        print("\nAI Organization Plan:")
-        print("-" * 40)
-        print(f"  Show: {plan.show_name}")
-        if plan.year:
-            print(f"  Year: {plan.year}")
-        print(f"  Summary: {plan.summary}")
-        print("  Note: Original filenames are preserved during organization")
+                # Convert to text format
+                tree_text = generator.tree_to_text(show_tree)
+                print("\nCurrent Structure:")
+                print("-" * 40)
+                print(tree_text)
 
-        if plan.warnings:
-            print("\nWarnings:")
-            for warning in plan.warnings:
-                print(f"  ⚠️  {warning}")
+                batch.append((show_name, tree_text))
 
-        print(f"\nSuggested Operations ({len(plan.suggestions)}):")
-        for i, suggestion in enumerate(plan.suggestions, 1):
-            print(f"{i:2d}. {suggestion.operation.upper()}")
-            if suggestion.operation == 'create_directory':
-                print(f"    Create: {suggestion.destination_path}")
-            elif suggestion.operation == 'move':
-                print(f"    Move: {suggestion.source_path}")
-                print(f"      To: {suggestion.destination_path}")
-                print(f"    Confidence: {suggestion.confidence:.1%}")
-                print(f"    (Filename preserved: {Path(suggestion.source_path).name})")
-            print(f"    Reason: {suggestion.reason}")
-
-        # Preview execution (dry run)
-        print("\nExecution Preview:")
-        print("-" * 40)
-        preview = file_ops.preview_plan(plan)
-        print(preview)
+            if batch:
+                batches.append(batch)
+
+        if not batches:
+            return
+
+        # Get AI organization suggestions, overlapping the independent requests
+        print(f"\nGetting AI suggestions in {len(batches)} request(s)...")
+        with ThreadPoolExecutor(max_workers=min(MAX_AI_WORKERS, len(batches))) as executor:
+            for plans in executor.map(organizer.organize_tv_shows_batch, batches):
+                for plan in plans:
+                    _print_tv_show_plan(plan, file_ops)
 
         # Note about execution
         print("\n💡 This is a DRY RUN - no files were moved")
@@ -162,13 +251,13 @@ def example_tv_show_organization():
 
 def example_movie_organization():
     """Production example: Organize movies using AI."""
+    from file_operations import FileOperations
+
     print("\n" + "=" * 60)
     print("PRODUCTION EXAMPLE: Movie Organization")
     print("=" * 60)
 
-    # Load environment variables
-    load_dotenv()
-    api_key = os.getenv('GEMINI_API_KEY')
+    api_key = _config()['api_key']
 
     if not api_key:
         print("⚠️  GEMINI_API_KEY not found in environment")
@@ -178,26 +267,42 @@ def example_movie_organization():
     # Example movie path (replace with real path)
     movies_path = "/path/to/movies"  # Change this!
 
-    if not Path(movies_path).exists():
+    try:
+        with os.scandir(movies_path) as entries:
+            generator = TreeGenerator.from_scandir(entries, movies_path)
+    except (FileNotFoundError, NotADirectoryError):
         print(f"⚠️  Path doesn't exist: {movies_path}")
         print("Please update the movies_path variable in this script")
         return
+    except OSError as e:
+        print(f"Error: {e}")
+        return
 
     try:
         # Initialize components
-        generator = TreeGenerator(movies_path)
-        organizer = AIOrganizer(api_key)
+        organizer = _get_organizer()
         file_ops = FileOperations(movies_path, dry_run=True)  # Always dry run in example
 
         # Generate tree for movies (limited depth for movies)
         print("Analyzing movie collection...")
-        tree = generator.generate_tree(max_depth=2)
+        tree = _get_tree(generator, max_depth=2)
 
-        # Convert to text format
-        tree_text = generator.tree_to_text(tree)
+        # Convert to text format, printing only the first part of large trees
         print("\nCurrent Structure:")
         print("-" * 40)
-        print(tree_text[:2000] + "..." if len(tree_text) > 2000 else tree_text)
+        lines = []
+        shown = 0
+        truncated = False
+        for line in generator.iter_tree_lines(tree):
+            lines.append(line)
+            if shown < 2000:
+                sys.stdout.write(line)
+                shown += len(line)
+            else:
+                truncated = True
+        if truncated:
+            print("...")
+        tree_text = "".join(lines)
 
         # Get AI organization suggestions
         print("\nGetting AI suggestions...")
@@ -214,18 +319,22 @@ def example_movie_organization():
             for warning in plan.warnings:
                 print(f"  ⚠️  {warning}")
 
-        print(f"\nSuggested Operations ({len(plan.suggestions)}):")
+        # Build the whole listing first and write it once
+        lines = [f"\nSuggested Operations ({len(plan.suggestions)}):"]
         for i, suggestion in enumerate(plan.suggestions[:10], 1):  # Show first 10
-            print(f"{i:2d}. {suggestion.operation.upper()}")
+            lines.append(f"{i:2d}. {suggestion.operation.upper()}")
             if suggestion.operation == 'create_directory':
-                print(f"    Create: {suggestion.destination_path}")
+                lines.append(f"    Create: {suggestion.destination_path}")
             elif suggestion.operation == 'move':
-                print(f"    Move: {Path(suggestion.source_path).name}")
-                print(f"      To: {suggestion.destination_path}")
-                print(f"    Confidence: {suggestion.confidence:.1%}")
+                lines.extend([
+                    f"    Move: {os.path.basename(suggestion.source_path)}",
+                    f"      To: {suggestion.destination_path}",
+                    f"    Confidence: {suggestion.confidence:.1%}",
+                ])
 
         if len(plan.suggestions) > 10:
-            print(f"    ... and {len(plan.suggestions) - 10} more operations")
+            lines.append(f"    ... and {len(plan.suggestions) - 10} more operations")
+        sys.stdout.write("\n".join(lines) + "\n")
 
         # Note about execution
         print("\n💡 This is a DRY RUN - no files were moved")
@@ -267,19 +376,23 @@ def example_create_test_structure():
     ]
 
     try:
-        # Create TV shows structure
-        tv_dir = test_dir / "TV Shows"
-        for show_file in tv_shows:
-            file_path = tv_dir / show_file
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.touch()  # Create empty file
-
-        # Create movies structure
-        movies_dir = test_dir / "Movies"
-        for movie_file in movies:
-            file_path = movies_dir / movie_file
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.touch()  # Create empty file
+        # Plain string joins keep Path object construction out of the loop
+        tv_dir = os.path.join(str(test_dir), "TV Shows")
+        movies_dir = os.path.join(str(test_dir), "Movies")
+        all_files = [os.path.join(tv_dir, f) for f in tv_shows]
+        all_files += [os.path.join(movies_dir, f) for f in movies]
+
+        # Create each parent directory once
+        for parent in {os.path.dirname(f) for f in all_files}:
+            os.makedirs(parent, exist_ok=True)
+
+        # Create empty files
+        for file_path in all_files:
+            fd = os.open(file_path, os.O_CREAT | os.O_WRONLY, 0o644)
+            os.close(fd)
+
+        # Trees scanned earlier in this session are now stale
+        _TREE_CACHE.clear()
 
         print("✅ Test structure created successfully!")
         print("\nCreated structure:")
@@ -292,7 +405,7 @@ def example_create_test_structure():
 
         # Show the created structure
         generator = TreeGenerator(str(test_dir))
-        tree = generator.generate_tree(max_depth=4)
+        tree = _get_tree(generator, max_depth=4)
         print("\nGenerated Test Structure:")
         print("-" * 40)
         print(generator.tree_to_text(tree))
@@ -307,9 +420,7 @@ def example_ai_connection_test():
     print("PRODUCTION EXAMPLE: AI Connection Test")
     print("=" * 60)
 
-    # Load environment variables
-    load_dotenv()
-    api_key = os.getenv('GEMINI_API_KEY')
+    api_key = _config()['api_key']
 
     if not api_key:
         print("⚠️  GEMINI_API_KEY not found in environment")
@@ -318,7 +429,7 @@ def example_ai_connection_test():
 
     try:
         # Test AI connection
-        organizer = AIOrganizer(api_key)
+        organizer = _get_organizer()
 
         print("Testing AI connection...")
         if organizer.test_connection():
@@ -359,7 +470,7 @@ Silicon Valley/
             for i, suggestion in enumerate(plan.suggestions[:3], 1):
                 print(f"  {i}. {suggestion.operation}: {suggestion.reason}")
                 if suggestion.operation == 'move':
-                    print(f"     (Original filename preserved: {Path(suggestion.source_path).name})")
+                    print(f"     (Original filename preserved: {os.path.basename(suggestion.source_path)})")
 
         print("\n✅ AI test completed successfully!")
 
@@ -367,8 +478,20 @@ Silicon Valley/
         print(f"Error testing AI: {e}")
 
 
-def main():
+def parse_args(argv=None):
+    """Parse command-line flags so the examples can run without a TTY."""
+    parser = argparse.ArgumentParser(description="Run the media organizer production examples")
+    parser.add_argument('--create-test', action='store_true',
+                        help='Create the test_media directory structure without prompting')
+    parser.add_argument('--test-ai', action='store_true',
+                        help='Run the AI connection test before the examples')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Run production examples."""
+    args = parse_args(argv)
+
     print("🎬 AI-Powered Media Library Organizer - Production Examples")
     print("=" * 65)
 
@@ -378,18 +501,21 @@ def main():
     print("3. Package installation: pip install -e .")
     print("4. Update paths in this script to match your environment")
 
+    if args.create_test:
+        example_create_test_structure()
+
     # Check if .env exists
     if not Path('.env').exists():
         print("\n⚠️  No .env file found!")
         print("Please copy .env.example to .env and configure your settings")
 
-        if input("\nCreate test structure? (y/N): ").lower() == 'y':
-            example_create_test_structure()
+        # Only prompt when someone is there to answer
+        if not args.create_test and sys.stdin.isatty():
+            if input("\nCreate test structure? (y/N): ").lower() == 'y':
+                example_create_test_structure()
         return
 
-    # Load environment to check setup
-    load_dotenv()
-    api_key = os.getenv('GEMINI_API_KEY')
+    api_key = _config()['api_key']
 
     if not api_key:
         print("\n⚠️  GEMINI_API_KEY not configured in .env file")
@@ -399,12 +525,15 @@ def main():
     # Run production examples
     print("\n🚀 Running Production Examples...")
 
-    # Test AI connection first
-    example_ai_connection_test()
+    # The first real AI call doubles as the connection check, so the extra
+    # round-trip of the explicit test only runs on request
+    if args.test_ai:
+        example_ai_connection_test()
 
     print("\n📋 Available Examples:")
     print("  - Uncomment example functions below to run specific examples")
     print("  - Update media paths to match your environment")
+    print("  - Pass --test-ai to run the AI connection test first")
 
     # Uncomment and update paths as needed:
     # example_scan_directory()
@@ -7,7 +7,9 @@ It will guide you through setup and test your configuration.
 """
 
 import os
+import re
 import sys
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -31,14 +33,70 @@ def check_python():
     print(f"✅ Python {version.major}.{version.minor}.{version.micro}")
     return True
 
+def requirements_satisfied(requirements_file="requirements.txt"):
+    """Check whether every requirement is already installed at a matching version."""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        from packaging.requirements import InvalidRequirement, Requirement
+    except ImportError:
+        return False
+
+    try:
+        raw = Path(requirements_file).read_bytes().decode('utf-8')
+    except (OSError, UnicodeDecodeError):
+        return False
+
+    for line in raw.splitlines():
+        # Like pip, a "#" at the start of a line or after whitespace begins a comment
+        line = re.sub(r'(^|\s)#.*', '', line).strip()
+        if not line:
+            continue
+        if line.startswith('-'):
+            # Nested, constraint and editable requirements can't be checked here; leave them to pip
+            if line.startswith(('-r', '-c', '-e', '--requirement', '--constraint', '--editable')):
+                return False
+            # Other options (--index-url, ...) don't name requirements
+            continue
+
+        try:
+            req = Requirement(line)
+        except InvalidRequirement:
+            return False
+        if req.marker and not req.marker.evaluate():
+            continue
+        try:
+            installed = version(req.name)
+        except PackageNotFoundError:
+            return False
+        if not req.specifier.contains(installed, prereleases=True):
+            return False
+
+    return True
+
 def install_requirements():
     """Install required packages."""
+    if requirements_satisfied():
+        print("✅ Requirements already satisfied")
+        return True
+
     print("Installing required packages...")
+    pip_args = ["install", "-r", "requirements.txt"]
+
+    # pip's internal API is not stable, so fall back to a separate process
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        pip_main = None
+
+    if pip_main is not None:
+        returncode = pip_main(pip_args)
+    else:
+        returncode = subprocess.call([sys.executable, "-m", "pip"] + pip_args)
+
+    if returncode == 0:
         print("✅ Requirements installed successfully")
         return True
-    except subprocess.CalledProcessError:
+    else:
         print("❌ Failed to install requirements")
         return False
 
@@ -54,11 +112,7 @@ def setup_environment():
     if env_example.exists():
         print("Creating .env file from template...")
         try:
-            with open(env_example, 'r') as f:
-                content = f.read()
-
-            with open(env_file, 'w') as f:
-                f.write(content)
+            shutil.copyfile(env_example, env_file)
 
             print("✅ .env file created")
             print("📝 Please edit .env file and add your Gemini API key")
@@ -72,6 +126,24 @@ def setup_environment():
 
 def test_cli():
     """Test if CLI is working."""
+    try:
+        sys.path.insert(0, str(Path("src").resolve()))
+        from click.testing import CliRunner
+        from main import cli
+    except ImportError:
+        return test_cli_subprocess()
+
+    result = CliRunner().invoke(cli, ["--help"])
+    if result.exit_code == 0:
+        print("✅ CLI is working correctly")
+        return True
+    else:
+        print("❌ CLI test failed")
+        print(result.output or result.exception)
+        return False
+
+def test_cli_subprocess():
+    """Test if CLI is working by running it in a separate interpreter."""
     try:
         result = subprocess.run([sys.executable, "src/main.py", "--help"],
                               capture_output=True, text=True)
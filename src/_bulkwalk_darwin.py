@@ -0,0 +1,164 @@
+"""
+Bulk Directory Listing for macOS
+
+This module lists directories with getattrlistbulk(2), which returns the name,
+type and size of many entries per system call. os.scandir only gets names and
+types from the directory read and needs a separate stat per file for its size.
+The entries it returns mimic the parts of ``os.DirEntry`` used by the tree
+generator. Importing it on any other platform raises ImportError.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import stat
+import struct
+import sys
+
+if sys.platform != 'darwin':
+    raise ImportError("getattrlistbulk is only available on macOS")
+
+_libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+_getattrlistbulk = _libc.getattrlistbulk
+_getattrlistbulk.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint64]
+_getattrlistbulk.restype = ctypes.c_int
+
+# <sys/attr.h>
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_FILE_TOTALSIZE = 0x00000002
+
+# <sys/vnode.h> fsobj_type_t values
+VREG = 1
+VDIR = 2
+VLNK = 5
+
+BUFFER_SIZE = 64 * 1024
+
+
+class _AttrList(ctypes.Structure):
+    _fields_ = [
+        ("bitmapcount", ctypes.c_ushort),
+        ("reserved", ctypes.c_uint16),
+        ("commonattr", ctypes.c_uint32),
+        ("volattr", ctypes.c_uint32),
+        ("dirattr", ctypes.c_uint32),
+        ("fileattr", ctypes.c_uint32),
+        ("forkattr", ctypes.c_uint32),
+    ]
+
+
+_ATTR_LIST = _AttrList(
+    bitmapcount=ATTR_BIT_MAP_COUNT,
+    commonattr=ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_NAME | ATTR_CMN_OBJTYPE,
+    fileattr=ATTR_FILE_TOTALSIZE,
+)
+
+# Entry length, then the attribute_set_t of returned attributes
+_HEADER = struct.Struct("=I5I")
+_ATTR_REFERENCE = struct.Struct("=iI")
+_OBJTYPE = struct.Struct("=I")
+_TOTALSIZE = struct.Struct("=q")
+
+
+class BulkDirEntry:
+    """Directory entry with the type and size read by getattrlistbulk."""
+
+    __slots__ = ('name', 'path', '_objtype', '_size', '_stat')
+
+    def __init__(self, name: str, path: str, objtype: int, size: int):
+        self.name = name
+        self.path = path
+        self._objtype = objtype
+        self._size = size
+        self._stat = None
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"<BulkDirEntry {self.name!r}>"
+
+    def is_dir(self) -> bool:
+        if self._objtype == VLNK:
+            return os.path.isdir(self.path)
+        return self._objtype == VDIR
+
+    def is_file(self) -> bool:
+        if self._objtype == VLNK:
+            return os.path.isfile(self.path)
+        return self._objtype == VREG
+
+    def is_symlink(self) -> bool:
+        return self._objtype == VLNK
+
+    def stat(self) -> os.stat_result:
+        """Return a stat result; only st_mode and st_size are filled unless this is a symlink."""
+        if self._stat is None:
+            if self._objtype == VLNK or self._objtype not in (VREG, VDIR):
+                self._stat = os.stat(self.path)
+            else:
+                mode = stat.S_IFDIR if self._objtype == VDIR else stat.S_IFREG
+                self._stat = os.stat_result((mode, 0, 0, 0, 0, 0, self._size, 0, 0, 0))
+        return self._stat
+
+
+def scandir_bulk(path) -> list:
+    """
+    List a directory with getattrlistbulk.
+
+    Args:
+        path: Directory to list
+
+    Returns:
+        List of BulkDirEntry objects in directory order
+
+    Raises:
+        OSError: If the directory cannot be opened or read
+    """
+    path = os.fspath(path)
+    buffer = ctypes.create_string_buffer(BUFFER_SIZE)
+    entries = []
+
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        while True:
+            count = _getattrlistbulk(fd, ctypes.byref(_ATTR_LIST), buffer, BUFFER_SIZE, 0)
+            if count == 0:
+                break
+            if count < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), path)
+
+            data = buffer.raw
+            offset = 0
+            for _ in range(count):
+                length, common, _vol, _dir, file_attrs, _fork = _HEADER.unpack_from(data, offset)
+                field = offset + _HEADER.size
+
+                name = None
+                if common & ATTR_CMN_NAME:
+                    name_offset, name_length = _ATTR_REFERENCE.unpack_from(data, field)
+                    start = field + name_offset
+                    # attr_length counts the trailing NUL
+                    name = os.fsdecode(data[start:start + name_length - 1])
+                    field += _ATTR_REFERENCE.size
+
+                objtype = 0
+                if common & ATTR_CMN_OBJTYPE:
+                    objtype, = _OBJTYPE.unpack_from(data, field)
+                    field += _OBJTYPE.size
+
+                size = 0
+                if file_attrs & ATTR_FILE_TOTALSIZE:
+                    size, = _TOTALSIZE.unpack_from(data, field)
+
+                if name is not None:
+                    entries.append(BulkDirEntry(name, os.path.join(path, name), objtype, size))
+                offset += length
+    finally:
+        os.close(fd)
+
+    return entries
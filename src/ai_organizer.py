@@ -6,158 +6,37 @@ suggestions for media files and directories using the google-genai library.
 """
 
 import os
+import atexit
 import json
+import logging
+import asyncio
 import re
-from typing import Dict, List, Optional, Tuple, Union
+import sys
+import hashlib
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 
 import google.genai as genai
-from google.genai import types
+from google.genai import errors, types
 
-from tree_generator import DirectoryNode, TreeGenerator
-
-
-@dataclass
-class OrganizationSuggestion:
-    """Represents an AI suggestion for organizing media files."""
-    source_path: str
-    destination_path: str
-    operation: str  # 'move', 'rename', 'create_directory'
-    confidence: float
-    reason: str
-
-
-@dataclass
-class OrganizationPlan:
-    """Complete organization plan for a media collection."""
-    show_name: str
-    year: Optional[int]
-    suggestions: List[OrganizationSuggestion]
-    summary: str
-    warnings: List[str]
-
-
-class AIOrganizer:
-    """Handles AI-powered media organization using Google Gemini."""
-
-    def __init__(self, api_key: str, model_name: str = "gemini-1.5-flash"):
-        """
-        Initialize the AI organizer.
-
-        Args:
-            api_key: Google Gemini API key
-            model_name: Name of the Gemini model to use
-        """
-        self.api_key = api_key
-        self.model_name = model_name
-
-        # Initialize the client
-        self.client = genai.Client(api_key=api_key)
-
-    def organize_tv_show(self, tree_text: str, show_folder_name: str) -> OrganizationPlan:
-        """
-        Get organization suggestions for a TV show directory.
-
-        Args:
-            tree_text: Text representation of the directory tree
-            show_folder_name: Name of the show folder being organized
-
-        Returns:
-            OrganizationPlan with suggestions for organizing the show
-        """
-        prompt = self._create_tv_show_prompt(tree_text, show_folder_name)
-
-        try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.1,
-                    top_p=0.8,
-                    top_k=40,
-                    max_output_tokens=8192,
-                    safety_settings=[
-                        types.SafetySetting(
-                            category=types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-                            threshold=types.HarmBlockThreshold.BLOCK_NONE
-                        ),
-                        types.SafetySetting(
-                            category=types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-                            threshold=types.HarmBlockThreshold.BLOCK_NONE
-                        ),
-                        types.SafetySetting(
-                            category=types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-                            threshold=types.HarmBlockThreshold.BLOCK_NONE
-                        ),
-                        types.SafetySetting(
-                            category=types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-                            threshold=types.HarmBlockThreshold.BLOCK_NONE
-                        ),
-                    ]
-                )
-            )
-            return self._parse_tv_show_response(response.text, show_folder_name)
-        except Exception as e:
-            raise Exception(f"Failed to get AI response: {str(e)}")
+try:
+    # Optional C-accelerated decoder; its JSONDecodeError subclasses json's
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
-    def organize_movie_collection(self, tree_text: str, movies_folder_name: str) -> OrganizationPlan:
-        """
-        Get organization suggestions for a movie collection.
-
-        Args:
-            tree_text: Text representation of the directory tree
-            movies_folder_name: Name of the movies folder being organized
-
-        Returns:
-            OrganizationPlan with suggestions for organizing the movies
-        """
-        prompt = self._create_movie_prompt(tree_text, movies_folder_name)
-
-        try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.1,
-                    top_p=0.8,
-                    top_k=40,
-                    max_output_tokens=8192,
-                    safety_settings=[
-                        types.SafetySetting(
-                            category=types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-                            threshold=types.HarmBlockThreshold.BLOCK_NONE
-                        ),
-                        types.SafetySetting(
-                            category=types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-                            threshold=types.HarmBlockThreshold.BLOCK_NONE
-                        ),
-                        types.SafetySetting(
-                            category=types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-                            threshold=types.HarmBlockThreshold.BLOCK_NONE
-                        ),
-                        types.SafetySetting(
-                            category=types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-                            threshold=types.HarmBlockThreshold.BLOCK_NONE
-                        ),
-                    ]
-                )
-            )
-            return self._parse_movie_response(response.text, movies_folder_name)
-        except Exception as e:
-            raise Exception(f"Failed to get AI response: {str(e)}")
-
-    def _create_tv_show_prompt(self, tree_text: str, show_folder_name: str) -> str:
-        """Create a detailed prompt for TV show organization."""
-        return f"""
-You are an expert media library organizer. I need you to analyze the following TV show directory structure and provide organization suggestions.
+from tree_generator import DirectoryNode, TreeGenerator
 
-**SHOW FOLDER:** {show_folder_name}
+logger = logging.getLogger(__name__)
 
-**CURRENT DIRECTORY STRUCTURE:**
-```
-{tree_text}
-```
+# Static instructions that open every prompt, ahead of the per-request folder and tree
+TV_PROMPT_PREFIX = """
+You are an expert media library organizer. I need you to analyze a TV show directory structure and provide organization suggestions. The show folder and its current directory structure follow these instructions.
 
 **DESIRED ORGANIZATION FORMAT:**
 Show Name (Year)
@@ -182,26 +61,26 @@ Show Name (Year)
 **RESPONSE FORMAT:**
 Please respond with a JSON object containing:
 ```json
-{{
+{
     "show_name": "Extracted Show Name",
     "year": 2021,
     "summary": "Brief description of what needs to be organized",
     "warnings": ["Any potential issues or conflicts"],
     "operations": [
-        {{
+        {
             "operation": "create_directory",
             "destination_path": "Show Name (2021)/Season 01",
             "reason": "Create season directory"
-        }},
-        {{
+        },
+        {
             "operation": "move",
             "source_path": "current/path/to/file.mkv",
             "destination_path": "Show Name (2021)/Season 01/file.mkv",
             "confidence": 0.95,
             "reason": "Move episode to correct season folder"
-        }}
+        }
     ]
-}}
+}
 ```
 
 **IMPORTANT:**
@@ -210,21 +89,10 @@ Please respond with a JSON object containing:
 - ALWAYS preserve original filenames - never rename files
 - Handle duplicate episodes by keeping the highest quality version
 - Include confidence scores (0.0 to 1.0) for each operation
-
-Analyze the structure and provide your organization suggestions:
 """
 
-    def _create_movie_prompt(self, tree_text: str, movies_folder_name: str) -> str:
-        """Create a detailed prompt for movie collection organization."""
-        return f"""
-You are an expert media library organizer. I need you to analyze the following movies directory structure and provide organization suggestions.
-
-**MOVIES FOLDER:** {movies_folder_name}
-
-**CURRENT DIRECTORY STRUCTURE:**
-```
-{tree_text}
-```
+MOVIE_PROMPT_PREFIX = """
+You are an expert media library organizer. I need you to analyze a movies directory structure and provide organization suggestions. The movies folder and its current directory structure follow these instructions.
 
 **DESIRED ORGANIZATION FORMAT:**
 Movies/
@@ -248,25 +116,25 @@ Movies/
 **RESPONSE FORMAT:**
 Please respond with a JSON object containing:
 ```json
-{{
+{
     "collection_name": "Movies",
     "summary": "Brief description of what needs to be organized",
     "warnings": ["Any potential issues or conflicts"],
     "operations": [
-        {{
+        {
             "operation": "create_directory",
             "destination_path": "Movie Name (2008)",
             "reason": "Create movie directory"
-        }},
-        {{
+        },
+        {
             "operation": "move",
             "source_path": "current/path/to/movie.mkv",
             "destination_path": "Movie Name (2008)/movie.mkv",
             "confidence": 0.95,
             "reason": "Move movie to organized folder"
-        }}
+        }
     ]
-}}
+}
 ```
 
 **IMPORTANT:**
@@ -275,140 +143,1114 @@ Please respond with a JSON object containing:
 - Be conservative with moves if movie identification is unclear
 - Include confidence scores (0.0 to 1.0) for each operation
 - ALWAYS preserve original filenames - never rename files
+"""
+
+# Per-request parts of the prompts, filled in with str.format
+_TV_PROMPT_SUFFIX = """
+**SHOW FOLDER:** {show_folder_name}
+
+**CURRENT DIRECTORY STRUCTURE:** (tree legend: "> " entry, "+ " last entry in its folder, "| " parent folder continues, two spaces per level below a last entry)
+```
+{tree_text}
+```
 
 Analyze the structure and provide your organization suggestions:
 """
 
-    def _parse_tv_show_response(self, response_text: str, show_folder_name: str) -> OrganizationPlan:
-        """Parse AI response for TV show organization."""
+_MOVIE_PROMPT_SUFFIX = """
+**MOVIES FOLDER:** {movies_folder_name}
+
+**CURRENT DIRECTORY STRUCTURE:** (tree legend: "> " entry, "+ " last entry in its folder, "| " parent folder continues, two spaces per level below a last entry)
+```
+{tree_text}
+```
+
+Analyze the structure and provide your organization suggestions:
+"""
+
+_TV_BATCH_PROMPT_TEMPLATE = """
+You are an expert media library organizer. I need you to analyze the following TV show directory structures and provide organization suggestions for each show.
+
+Each show starts with a line of the form ---SHOW:<folder name>--- followed by its directory tree (tree legend: "> " entry, "+ " last entry in its folder, "| " parent folder continues, two spaces per level below a last entry).
+
+**CURRENT DIRECTORY STRUCTURES:**
+```
+{sections}
+```
+
+**DESIRED ORGANIZATION FORMAT (per show):**
+Show Name (Year)
+├── Season 01
+│   ├── Show.Name.S01E01.Episode.Title.Quality.mkv
+│   └── ...
+└── Season 02
+    └── ...
+
+**ORGANIZATION RULES:**
+1. Extract the correct show name and year from the files
+2. Create proper season folders (Season 01, Season 02, etc.)
+3. Move episode files to their respective season folders
+4. Keep the highest quality version if multiple qualities exist for the same episode
+5. Preserve subtitle files (.srt, .sub, etc.) alongside their video files
+6. Remove unnecessary nested directories
+7. PRESERVE ORIGINAL FILENAMES - Do NOT rename files, only move them to correct folders
+8. Never move files between different shows
+
+**RESPONSE FORMAT:**
+Please respond with a JSON array containing one object per show:
+```json
+[
+    {{
+        "show_folder": "Folder name exactly as given after ---SHOW:",
+        "show_name": "Extracted Show Name",
+        "year": 2021,
+        "summary": "Brief description of what needs to be organized",
+        "warnings": ["Any potential issues or conflicts"],
+        "operations": [
+            {{
+                "operation": "create_directory",
+                "destination_path": "Show Name (2021)/Season 01",
+                "reason": "Create season directory"
+            }},
+            {{
+                "operation": "move",
+                "source_path": "current/path/to/file.mkv",
+                "destination_path": "Show Name (2021)/Season 01/file.mkv",
+                "confidence": 0.95,
+                "reason": "Move episode to correct season folder"
+            }}
+        ]
+    }}
+]
+```
+
+**IMPORTANT:**
+- Only suggest operations that are clearly beneficial
+- Be conservative with file moves if you're unsure
+- ALWAYS preserve original filenames - never rename files
+- Handle duplicate episodes by keeping the highest quality version
+- Include confidence scores (0.0 to 1.0) for each operation
+
+Analyze the structures and provide your organization suggestions:
+"""
+
+# Finish reasons whose response text is worth parsing; MAX_TOKENS output may
+# still hold a complete JSON object before the cut-off
+_USABLE_FINISH_REASONS = (None, types.FinishReason.STOP, types.FinishReason.MAX_TOKENS)
+
+# Start of the operations array in a streamed response
+_OPERATIONS_START_RE = re.compile(r'"operations"\s*:\s*\[')
+
+# File size annotations added by TreeGenerator.tree_to_text, e.g. " (1.2 MB)"
+_SIZE_ANNOTATION_RE = re.compile(r' \(\d+\.\d MB\)$', re.MULTILINE)
+
+
+def _balanced_end(text: str, start: int, opener: str, closer: str) -> Optional[int]:
+    """Return the index just past the bracket closing the one at start, or None if it is never closed."""
+    depth = 0
+    in_str = False
+    esc = False
+    for j in range(start, len(text)):
+        ch = text[j]
+        if in_str:
+            if esc:
+                esc = False
+            elif ch == '\\':
+                esc = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == opener:
+            depth += 1
+        elif ch == closer:
+            depth -= 1
+            if depth == 0:
+                return j + 1
+
+    return None
+
+
+def _extract_json_object(text: str, opener: str = '{') -> Tuple[Optional[str], Any]:
+    """
+    Find and decode the first balanced JSON object (or array) embedded in text that parses.
+
+    Scanning starts inside a ```json fence when the model used one, otherwise
+    at the first opening bracket, tracking nesting depth and skipping brackets
+    inside string literals. A balanced candidate that isn't valid JSON (such
+    as "{show}" in the model's preamble) is skipped in favour of the next one.
+
+    Args:
+        text: Model response text
+        opener: '{' to extract an object, '[' to extract an array
+
+    Returns:
+        Tuple of (JSON text, decoded value), or (None, None) if no balanced value was found
+
+    Raises:
+        json.JSONDecodeError: The first candidate's error, if none of them parse
+    """
+    closer = '}' if opener == '{' else ']'
+    fence = text.find("```json")
+    start = text.find(opener, fence) if fence != -1 else -1
+    if start == -1:
+        start = text.find(opener)
+
+    first_error = None
+    while start != -1:
+        end = _balanced_end(text, start, opener, closer)
+        if end is None:
+            # Every later opener is nested inside this unclosed value
+            break
+
+        candidate = text[start:end]
         try:
-            # Log full response for debugging
-            print(f"Full AI response text: {response_text}")
+            return candidate, _json_loads(candidate)
+        except json.JSONDecodeError as e:
+            if first_error is None:
+                first_error = e
+        start = text.find(opener, start + 1)
 
-            # Extract JSON from response
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-            if not json_match:
-                # Try to find JSON without code blocks
-                json_match = re.search(r'(\{.*\})', response_text, re.DOTALL)
+    if first_error is not None:
+        raise first_error
+    return None, None
 
-            if not json_match:
-                print(f"No JSON found in response: {response_text[:1000]}")
-                raise ValueError("No valid JSON found in AI response")
 
-            json_text = json_match.group(1)
+# Compact replacements for the box-drawing units TreeGenerator.tree_to_text
+# puts in front of each name; explained to the model by the prompt's tree legend
+_TREE_MARKERS = {
+    "├── ": "> ",
+    "└── ": "+ ",
+    "│   ": "| ",
+    "    ": "  ",
+}
 
-            # Debug output for malformed JSON
-            print(f"Extracted JSON text length: {len(json_text)}")
-            print(f"Raw JSON response (first 500 chars): {json_text[:500]}")
-            print(f"Raw JSON response (last 500 chars): {json_text[-500:]}")
 
+def _compact_tree(tree_text: str) -> str:
+    """
+    Shrink a tree listing before it is embedded in a prompt.
 
+    Each four-character box-drawing unit in a line's prefix becomes a
+    two-character marker and trailing whitespace and blank lines are dropped.
+    Names are left untouched, so the model can still quote exact paths.
+    """
+    lines = []
+    for line in tree_text.splitlines():
+        line = line.rstrip()
+        if not line:
+            continue
+
+        parts = []
+        pos = 0
+        marker = _TREE_MARKERS.get(line[:4])
+        while marker is not None:
+            parts.append(marker)
+            pos += 4
+            marker = _TREE_MARKERS.get(line[pos:pos + 4])
+        parts.append(line[pos:])
+        lines.append("".join(parts))
+
+    return "\n".join(lines)
+
+
+def _normalize_tree_text(compact_tree: str) -> str:
+    """
+    Strip details of a compacted tree listing that don't affect the organization plan.
+
+    File sizes change while downloads complete; that doesn't change which moves
+    are needed, so they are dropped before computing a cache key. Trailing
+    whitespace and blank lines are already gone after _compact_tree.
+    """
+    return _SIZE_ANNOTATION_RE.sub('', compact_tree)
+
+
+# One Gemini client per API key, shared by every AIOrganizer and closed at exit
+_CLIENT_CACHE: Dict[str, genai.Client] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_client(api_key: str) -> genai.Client:
+    """Return the shared Gemini client for an API key, creating it on first use."""
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            client = _CLIENT_CACHE[api_key] = genai.Client(api_key=api_key)
+        return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close the shared Gemini clients when the interpreter exits."""
+    with _CLIENT_CACHE_LOCK:
+        for client in _CLIENT_CACHE.values():
+            client.close()
+        _CLIENT_CACHE.clear()
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get regular instances
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class OrganizationSuggestion:
+    """Represents an AI suggestion for organizing media files."""
+    source_path: str
+    destination_path: str
+    operation: str  # 'move', 'rename', 'create_directory'
+    confidence: float
+    reason: str
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class OrganizationPlan:
+    """Complete organization plan for a media collection."""
+    show_name: str
+    year: Optional[int]
+    suggestions: List[OrganizationSuggestion]
+    summary: str
+    warnings: List[str]
+
+
+class _OperationStreamParser:
+    """Pull complete operation objects out of a JSON response as it streams in."""
+
+    def __init__(self):
+        self._buffer = ""
+        self._in_operations = False
+        self._decoder = json.JSONDecoder()
+        self.done = False
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Add a chunk of response text.
+
+        Returns:
+            Operation objects completed by this chunk
+        """
+        self._buffer += text
+        operations = []
+
+        if not self._in_operations:
+            match = _OPERATIONS_START_RE.search(self._buffer)
+            if not match:
+                return operations
+            self._buffer = self._buffer[match.end():]
+            self._in_operations = True
+
+        while not self.done:
+            # Skip separators between array elements
+            buffer = self._buffer.lstrip(" \t\r\n,")
+            if not buffer:
+                self._buffer = ""
+                break
+
+            if buffer[0] == ']':
+                self.done = True
+                break
 
             try:
-                data = json.loads(json_text)
-            except json.JSONDecodeError as json_err:
-                print(f"JSON decode error: {json_err}")
-                print(f"Problematic JSON around error: {json_text[max(0, json_err.pos-100):json_err.pos+100]}")
-                raise
+                op, end = self._decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                # Object is still incomplete; wait for more text
+                self._buffer = buffer
+                break
 
-            # Parse operations into suggestions
-            suggestions = []
-            for op in data.get('operations', []):
-                if op['operation'] == 'create_directory':
-                    suggestions.append(OrganizationSuggestion(
-                        source_path="",
-                        destination_path=op['destination_path'],
-                        operation='create_directory',
-                        confidence=1.0,
-                        reason=op['reason']
-                    ))
-                elif op['operation'] == 'move':
-                    suggestions.append(OrganizationSuggestion(
-                        source_path=op['source_path'],
-                        destination_path=op['destination_path'],
-                        operation='move',
-                        confidence=op.get('confidence', 0.8),
-                        reason=op['reason']
-                    ))
-
-            return OrganizationPlan(
-                show_name=data.get('show_name', show_folder_name),
-                year=data.get('year'),
-                suggestions=suggestions,
-                summary=data.get('summary', ''),
-                warnings=data.get('warnings', [])
-            )
+            operations.append(op)
+            self._buffer = buffer[end:]
 
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"JSON parsing failed: {str(e)}")
-            print(f"Full response that failed: {response_text}")
-            raise ValueError(f"Failed to parse AI response: {str(e)}")
+        return operations
 
-    def _parse_movie_response(self, response_text: str, movies_folder_name: str) -> OrganizationPlan:
-        """Parse AI response for movie collection organization."""
+    @property
+    def unfinished(self) -> bool:
+        """Whether the operations array was opened but not yet closed."""
+        return self._in_operations and not self.done
+
+
+class RateLimiter:
+    """Thread-safe token bucket that caps requests per minute."""
+
+    def __init__(self, requests_per_minute: int):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Maximum sustained request rate
+        """
+        self.capacity = float(requests_per_minute)
+        self.fill_rate = requests_per_minute / 60.0
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request slot is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.fill_rate)
+                self.last_refill = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.fill_rate
+
+            time.sleep(wait)
+
+
+@dataclass
+class ResponseCacheConfig:
+    """Operator settings for the response cache."""
+    enabled: bool = True
+    ttl_seconds: int = 24 * 3600
+    max_entries: int = 500
+
+
+class ResponseCache:
+    """
+    Exact-match LRU cache of Gemini response text, persisted as a JSON file.
+
+    Entries expire after their TTL and the least recently used ones are evicted
+    once max_entries is exceeded, so memory stays bounded in long-running
+    processes. The file is written when the interpreter exits (or on flush()),
+    merged with whatever other processes saved to it in the meantime. Use
+    shared() to get the one instance per file within a process.
+    """
+
+    DEFAULT_PATH = Path.home() / ".cache" / "organize-media" / "llm_cache.json"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, ttl_seconds: int = 24 * 3600,
+                 max_entries: int = 500):
+        """
+        Initialize the response cache.
+
+        Args:
+            path: JSON file backing the cache (defaults to ~/.cache/organize-media/llm_cache.json)
+            ttl_seconds: How long a stored response stays valid
+            max_entries: Maximum number of responses kept; least recently used are evicted first
+        """
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Optional["OrderedDict[str, Dict[str, Any]]"] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    @classmethod
+    def shared(cls, path: Optional[Union[str, Path]] = None, ttl_seconds: int = 24 * 3600,
+               max_entries: int = 500) -> 'ResponseCache':
+        """
+        Return the process-wide cache backed by a file, creating it on first use.
+
+        Later callers get the existing instance, with the settings it was created with.
+        """
+        path = Path(path) if path else cls.DEFAULT_PATH
+        with _RESPONSE_CACHES_LOCK:
+            cache = _RESPONSE_CACHES.get(path)
+            if cache is None:
+                cache = _RESPONSE_CACHES[path] = cls(path, ttl_seconds=ttl_seconds, max_entries=max_entries)
+            return cache
+
+    @classmethod
+    def from_config(cls, config: ResponseCacheConfig,
+                    path: Optional[Union[str, Path]] = None) -> Optional['ResponseCache']:
+        """Return the shared cache for operator settings, or None if caching is disabled."""
+        if not config.enabled:
+            return None
+        return cls.shared(path, ttl_seconds=config.ttl_seconds, max_entries=config.max_entries)
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str, config_fingerprint: str) -> str:
+        """Build the cache key for a (model, prompt, generation config) request."""
+        payload = b"\0".join([model_name.encode(), prompt.encode(), config_fingerprint.encode()])
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text for a key, or None if missing or expired."""
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None:
+                return None
+
+            if time.time() - entry['created'] > entry['ttl_seconds']:
+                del entries[key]
+                self._dirty = True
+                return None
+
+            entries.move_to_end(key)
+            return entry['text']
+
+    def set(self, key: str, text: str):
+        """Store response text under a key, evicting the least recently used entries."""
+        with self._lock:
+            entries = self._load()
+            entries[key] = {
+                'text': text,
+                'created': time.time(),
+                'ttl_seconds': self.ttl_seconds
+            }
+            entries.move_to_end(key)
+            self._evict()
+            self._dirty = True
+
+    def flush(self):
+        """Persist the cache if it changed since it was loaded or last flushed."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+                self._dirty = False
+
+    def _evict(self):
+        """Drop least recently used entries beyond max_entries."""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self) -> "OrderedDict[str, Dict[str, Any]]":
+        """Read the cache file on first use; the file is stored in recency order."""
+        if self._entries is None:
+            self._entries = self._read_file()
+            self._evict()
+
+        return self._entries
+
+    def _read_file(self) -> "OrderedDict[str, Dict[str, Any]]":
+        """
+        Read the entries stored in the cache file.
+
+        Entries that don't look like ours (written by another version or edited
+        by hand) are skipped, as is a file that can't be read or parsed.
+        """
         try:
-            # Log full response for debugging
-            print(f"Full AI response text: {response_text}")
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return OrderedDict()
+
+        if not isinstance(data, dict):
+            return OrderedDict()
+
+        return OrderedDict(
+            (key, entry) for key, entry in data.items()
+            if isinstance(entry, dict) and isinstance(entry.get('text'), str)
+            and isinstance(entry.get('created'), (int, float))
+            and isinstance(entry.get('ttl_seconds'), (int, float))
+        )
+
+    def _save(self):
+        """
+        Write the cache file atomically, merged with entries other writers saved meanwhile.
 
-            # Extract JSON from response
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-            if not json_match:
-                json_match = re.search(r'(\{.*\})', response_text, re.DOTALL)
+        Entries only on disk are kept as the least recently used; expired entries
+        are dropped. An unwritable location keeps the cache in memory only.
+        """
+        merged = OrderedDict((key, entry) for key, entry in self._read_file().items()
+                             if key not in self._entries)
+        merged.update(self._entries)
 
-            if not json_match:
-                print(f"No JSON found in response: {response_text[:1000]}")
-                raise ValueError("No valid JSON found in AI response")
+        now = time.time()
+        self._entries = OrderedDict((key, entry) for key, entry in merged.items()
+                                    if now - entry['created'] <= entry['ttl_seconds'])
+        self._evict()
+
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.path.parent,
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
-            json_text = json_match.group(1)
 
-            # Debug output for malformed JSON
-            print(f"Extracted JSON text length: {len(json_text)}")
-            print(f"Raw JSON response (first 500 chars): {json_text[:500]}")
-            print(f"Raw JSON response (last 500 chars): {json_text[-500:]}")
+# One ResponseCache per backing file, shared by every AIOrganizer in the process
+_RESPONSE_CACHES: Dict[Path, ResponseCache] = {}
+_RESPONSE_CACHES_LOCK = threading.Lock()
 
 
+class AIOrganizer:
+    """Handles AI-powered media organization using Google Gemini."""
+
+    # Number of shows sent per batched request
+    BATCH_SIZE = 5
+
+    # Async requests hitting rate limits (429) or server errors (5xx) are retried,
+    # waiting RETRY_BASE_DELAY * 2**attempt seconds between attempts
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 10.0
+
+    _SAFETY_SETTINGS = [
+        types.SafetySetting(
+            category=types.HarmCategory.HARM_CATEGORY_HARASSMENT,
+            threshold=types.HarmBlockThreshold.BLOCK_NONE
+        ),
+        types.SafetySetting(
+            category=types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+            threshold=types.HarmBlockThreshold.BLOCK_NONE
+        ),
+        types.SafetySetting(
+            category=types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+            threshold=types.HarmBlockThreshold.BLOCK_NONE
+        ),
+        types.SafetySetting(
+            category=types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+            threshold=types.HarmBlockThreshold.BLOCK_NONE
+        ),
+    ]
+
+    # Built once and never mutated
+    _GENERATION_CONFIG = types.GenerateContentConfig(
+        temperature=0.1,
+        top_p=0.8,
+        top_k=40,
+        max_output_tokens=8192,
+        safety_settings=_SAFETY_SETTINGS
+    )
+
+    _TEST_CONFIG = types.GenerateContentConfig(
+        temperature=0.1,
+        max_output_tokens=100
+    )
+
+    def __init__(self, api_key: str, model_name: str = "gemini-1.5-flash",
+                 requests_per_minute: Optional[int] = None, enable_cache: bool = True,
+                 cache_ttl_seconds: int = 24 * 3600,
+                 cache_config: Optional[ResponseCacheConfig] = None):
+        """
+        Initialize the AI organizer.
+
+        The organizer may be shared between threads; set requests_per_minute to
+        the model's RPM quota to avoid 429 errors when calling it concurrently.
+
+        Args:
+            api_key: Google Gemini API key
+            model_name: Name of the Gemini model to use
+            requests_per_minute: Optional cap on Gemini requests per minute
+            enable_cache: Reuse stored responses for identical organization requests
+            cache_ttl_seconds: How long cached responses stay valid
+            cache_config: Full response cache settings; overrides enable_cache and cache_ttl_seconds
+        """
+        self.api_key = api_key
+        self.model_name = model_name
+        self.rate_limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
+        if cache_config is None:
+            cache_config = ResponseCacheConfig(enabled=enable_cache, ttl_seconds=cache_ttl_seconds)
+        self.cache = ResponseCache.from_config(cache_config)
+
+        # Share one client (and its connection pool) per API key
+        self.client = _get_client(api_key)
+
+    def organize_tv_show(self, tree_text: str, show_folder_name: str) -> OrganizationPlan:
+        """
+        Get organization suggestions for a TV show directory.
+
+        Args:
+            tree_text: Text representation of the directory tree
+            show_folder_name: Name of the show folder being organized
+
+        Returns:
+            OrganizationPlan with suggestions for organizing the show
+        """
+        prompt, cache_prompt = self._create_tv_show_prompt(tree_text, show_folder_name)
+
+        try:
+            return self._request(prompt, lambda text: self._parse_tv_show_response(text, show_folder_name),
+                                 cache_prompt=cache_prompt)
+        except Exception as e:
+            raise Exception(f"Failed to get AI response: {str(e)}")
+
+    def organize_movie_collection(self, tree_text: str, movies_folder_name: str) -> OrganizationPlan:
+        """
+        Get organization suggestions for a movie collection.
+
+        Args:
+            tree_text: Text representation of the directory tree
+            movies_folder_name: Name of the movies folder being organized
+
+        Returns:
+            OrganizationPlan with suggestions for organizing the movies
+        """
+        prompt, cache_prompt = self._create_movie_prompt(tree_text, movies_folder_name)
+
+        try:
+            return self._request(prompt, lambda text: self._parse_movie_response(text, movies_folder_name),
+                                 cache_prompt=cache_prompt)
+        except Exception as e:
+            raise Exception(f"Failed to get AI response: {str(e)}")
+
+    def organize_tv_shows_batch(self, shows: List[Tuple[str, str]]) -> List[OrganizationPlan]:
+        """
+        Get organization suggestions for several TV show directories in one request.
+
+        Sending a handful of shows per request saves a Gemini round-trip per show.
+        Shows missing from the batched response, or with a malformed entry, are
+        retried individually, as is every show when the batched response can't
+        be parsed at all (e.g. cut off by the output token limit).
+
+        Args:
+            shows: List of (show_folder_name, tree_text) tuples, at most BATCH_SIZE long
+
+        Returns:
+            List of OrganizationPlan objects in the same order as ``shows``
+        """
+        if not shows:
+            return []
+
+        if len(shows) == 1:
+            show_folder_name, tree_text = shows[0]
+            return [self.organize_tv_show(tree_text, show_folder_name)]
+
+        prompt, cache_prompt = self._create_tv_show_batch_prompt(shows)
+
+        try:
+            plans_by_folder = self._request(prompt, self._parse_tv_show_batch_response,
+                                            cache_prompt=cache_prompt)
+        except ValueError as e:
+            logger.warning("Batched response unusable, organizing %d shows individually: %s", len(shows), e)
+            plans_by_folder = {}
+        except Exception as e:
+            raise Exception(f"Failed to get AI response: {str(e)}")
+
+        plans = []
+        for show_folder_name, tree_text in shows:
+            plan = plans_by_folder.get(show_folder_name)
+            if plan is None:
+                plan = self.organize_tv_show(tree_text, show_folder_name)
+            plans.append(plan)
+
+        return plans
+
+    async def organize_tv_show_async(self, tree_text: str, show_folder_name: str) -> OrganizationPlan:
+        """
+        Async version of organize_tv_show.
+
+        Args:
+            tree_text: Text representation of the directory tree
+            show_folder_name: Name of the show folder being organized
+
+        Returns:
+            OrganizationPlan with suggestions for organizing the show
+        """
+        prompt, cache_prompt = self._create_tv_show_prompt(tree_text, show_folder_name)
+
+        try:
+            return await self._request_async(prompt, lambda text: self._parse_tv_show_response(text, show_folder_name),
+                                             cache_prompt=cache_prompt)
+        except Exception as e:
+            raise Exception(f"Failed to get AI response: {str(e)}")
+
+    async def organize_movie_collection_async(self, tree_text: str, movies_folder_name: str) -> OrganizationPlan:
+        """
+        Async version of organize_movie_collection.
+
+        Args:
+            tree_text: Text representation of the directory tree
+            movies_folder_name: Name of the movies folder being organized
+
+        Returns:
+            OrganizationPlan with suggestions for organizing the movies
+        """
+        prompt, cache_prompt = self._create_movie_prompt(tree_text, movies_folder_name)
+
+        try:
+            return await self._request_async(prompt, lambda text: self._parse_movie_response(text, movies_folder_name),
+                                             cache_prompt=cache_prompt)
+        except Exception as e:
+            raise Exception(f"Failed to get AI response: {str(e)}")
+
+    async def organize_batch(self, jobs: List[Tuple[str, str, str]],
+                             max_concurrency: int = 8) -> List[Union[OrganizationPlan, Exception]]:
+        """
+        Organize several independent folders concurrently.
+
+        Args:
+            jobs: List of (kind, tree_text, folder_name) tuples where kind is 'tv' or 'movie'
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            One OrganizationPlan per job, in job order; a job that failed
+            yields its exception instead of a plan
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(kind: str, tree_text: str, folder_name: str) -> OrganizationPlan:
+            async with semaphore:
+                if kind == 'tv':
+                    return await self.organize_tv_show_async(tree_text, folder_name)
+                elif kind == 'movie':
+                    return await self.organize_movie_collection_async(tree_text, folder_name)
+                raise ValueError(f"Unknown job kind: {kind}")
+
+        return await asyncio.gather(*(run(*job) for job in jobs), return_exceptions=True)
+
+    def organize_tv_show_stream(self, tree_text: str, show_folder_name: str) -> Iterator[OrganizationSuggestion]:
+        """
+        Stream organization suggestions for a TV show as the response arrives.
+
+        Suggestions are yielded as soon as each operation object is complete,
+        so callers can start previewing moves before the model has finished.
+        Streamed responses bypass the response cache; use organize_tv_show
+        when the show name, summary and warnings are needed as well.
+
+        Args:
+            tree_text: Text representation of the directory tree
+            show_folder_name: Name of the show folder being organized
+
+        Yields:
+            OrganizationSuggestion objects in response order
+
+        Raises:
+            ValueError: If the response is blocked or cut off before the operations list is complete
+        """
+        prompt, _ = self._create_tv_show_prompt(tree_text, show_folder_name)
+        return self._stream_suggestions(prompt)
+
+    def organize_movie_collection_stream(self, tree_text: str,
+                                         movies_folder_name: str) -> Iterator[OrganizationSuggestion]:
+        """
+        Stream organization suggestions for a movie collection as the response arrives.
+
+        Args:
+            tree_text: Text representation of the directory tree
+            movies_folder_name: Name of the movies folder being organized
+
+        Yields:
+            OrganizationSuggestion objects in response order
+
+        Raises:
+            ValueError: If the response is blocked or cut off before the operations list is complete
+        """
+        prompt, _ = self._create_movie_prompt(tree_text, movies_folder_name)
+        return self._stream_suggestions(prompt)
+
+    def _stream_suggestions(self, prompt: str) -> Iterator[OrganizationSuggestion]:
+        """Send a prompt with generate_content_stream and yield suggestions incrementally."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        parser = _OperationStreamParser()
+        finish_reason = None
+        try:
+            for chunk in self.client.models.generate_content_stream(
+                model=self.model_name,
+                contents=prompt,
+                config=self._generation_config()
+            ):
+                if chunk.candidates:
+                    finish_reason = chunk.candidates[0].finish_reason or finish_reason
+                if not chunk.text:
+                    continue
+
+                for op in parser.feed(chunk.text):
+                    suggestion = self._suggestion_from_operation(op)
+                    if suggestion:
+                        yield suggestion
+        except KeyError as e:
+            raise ValueError(f"Failed to parse AI response: missing {str(e)}")
+
+        # Same checks as _response_text, so a cut-off stream never passes for a complete plan
+        if finish_reason not in _USABLE_FINISH_REASONS:
+            raise ValueError(f"Model did not return content: {finish_reason}")
+        if parser.unfinished:
+            raise ValueError(f"AI response ended before the operations list was complete: {finish_reason}")
+
+    def _request(self, prompt: str, parse: Callable[[str], Any], cache_prompt: Optional[str] = None) -> Any:
+        """
+        Send an organization prompt and parse the response, using the cache if enabled.
+
+        Responses are only cached once they parse, so a malformed answer is
+        never replayed on later runs.
+
+        Args:
+            prompt: Prompt sent to the model
+            parse: Turns the response text into the caller's result
+            cache_prompt: Normalized request text the cache key is built from (defaults to ``prompt``)
+        """
+        config = self._generation_config()
+        key = None
+
+        if self.cache:
+            key = self._cache_key(cache_prompt or prompt, config)
+            cached_text = self.cache.get(key)
+            if cached_text is not None:
+                logger.debug("Using cached response %s", key[:12])
+                return parse(cached_text)
+
+        response_text = self._response_text(self._generate(prompt, config))
+        result = parse(response_text)
+
+        if self.cache:
+            self.cache.set(key, response_text)
+
+        return result
+
+    async def _request_async(self, prompt: str, parse: Callable[[str], Any],
+                             cache_prompt: Optional[str] = None) -> Any:
+        """
+        Async counterpart of _request using google-genai's aio client.
+
+        Blocking work (response cache access, rate limiting and response
+        parsing) runs in the default executor so it never stalls the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        config = self._generation_config()
+        key = None
+
+        if self.cache:
+            key = self._cache_key(cache_prompt or prompt, config)
+            # The first lookup reads the cache file, and every one takes its lock
+            cached_text = await loop.run_in_executor(None, self.cache.get, key)
+            if cached_text is not None:
+                logger.debug("Using cached response %s", key[:12])
+                return await loop.run_in_executor(None, parse, cached_text)
+
+        response_text = self._response_text(await self._generate_async(prompt, config))
+        result = await loop.run_in_executor(None, parse, response_text)
+
+        if self.cache:
+            await loop.run_in_executor(None, self.cache.set, key, response_text)
+
+        return result
+
+    @staticmethod
+    def _response_text(response: types.GenerateContentResponse) -> str:
+        """
+        Return the text of a response, failing fast when the model produced none.
+
+        Blocked and refused responses are rejected on their finish reason
+        before any JSON extraction is attempted on them.
+        """
+        candidates = response.candidates
+        finish_reason = candidates[0].finish_reason if candidates else None
+        if not candidates or finish_reason not in _USABLE_FINISH_REASONS:
+            raise ValueError(f"Model did not return content: {finish_reason or 'no candidates'}")
+
+        return response.text or ""
+
+    def _cache_key(self, prompt: str, config: types.GenerateContentConfig) -> str:
+        """Build the response cache key for a prompt sent with a given config."""
+        return ResponseCache.make_key(self.model_name, prompt, config.model_dump_json(exclude_none=True))
+
+    def _generate(self, contents: str, config: Optional[types.GenerateContentConfig] = None):
+        """Send a generate_content request, honoring the rate limit if set."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        return self.client.models.generate_content(
+            model=self.model_name,
+            contents=contents,
+            config=config or self._generation_config()
+        )
+
+    async def _generate_async(self, contents: str, config: types.GenerateContentConfig):
+        """Send an async generate_content request, retrying rate-limit and server errors with backoff."""
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            if self.rate_limiter:
+                await loop.run_in_executor(None, self.rate_limiter.acquire)
 
             try:
-                data = json.loads(json_text)
+                return await self.client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=contents,
+                    config=config
+                )
+            except errors.APIError as e:
+                if attempt == self.MAX_RETRIES or not (e.code == 429 or (e.code or 0) >= 500):
+                    raise
+                delay = self.RETRY_BASE_DELAY * 2 ** attempt
+                logger.debug("Gemini request failed with %s, retrying in %.0fs", e.code, delay)
+                await asyncio.sleep(delay)
+
+    def _generation_config(self) -> types.GenerateContentConfig:
+        """Return the generation config shared by all organization requests."""
+        return self._GENERATION_CONFIG
+
+    def _create_tv_show_prompt(self, tree_text: str, show_folder_name: str) -> Tuple[str, str]:
+        """
+        Create a detailed prompt for TV show organization.
+
+        Returns:
+            Tuple of (prompt, cache key text); see _create_prompt
+        """
+        return self._create_prompt(TV_PROMPT_PREFIX, _TV_PROMPT_SUFFIX, tree_text,
+                                   show_folder_name=show_folder_name)
+
+    def _create_movie_prompt(self, tree_text: str, movies_folder_name: str) -> Tuple[str, str]:
+        """
+        Create a detailed prompt for movie collection organization.
+
+        Returns:
+            Tuple of (prompt, cache key text); see _create_prompt
+        """
+        return self._create_prompt(MOVIE_PROMPT_PREFIX, _MOVIE_PROMPT_SUFFIX, tree_text,
+                                   movies_folder_name=movies_folder_name)
+
+    @staticmethod
+    def _create_prompt(prefix: str, suffix: str, tree_text: str, **fields: str) -> Tuple[str, str]:
+        """
+        Build a prompt and the normalized text its response is cached under.
+
+        The tree is compacted once for both. The cache key text joins the
+        unformatted templates, the fields and the size-free tree instead of
+        formatting a second prompt.
+
+        Returns:
+            Tuple of (prompt, cache key text)
+        """
+        compact = _compact_tree(tree_text)
+        prompt = prefix + suffix.format(tree_text=compact, **fields)
+        cache_text = "\0".join([prefix, suffix, *fields.values(), _normalize_tree_text(compact)])
+        return prompt, cache_text
+
+    def _create_tv_show_batch_prompt(self, shows: List[Tuple[str, str]]) -> Tuple[str, str]:
+        """
+        Create a prompt covering several TV show folders at once.
+
+        Returns:
+            Tuple of (prompt, cache key text); see _create_prompt
+        """
+        sections = []
+        cache_parts = [_TV_BATCH_PROMPT_TEMPLATE]
+        for show_folder_name, tree_text in shows:
+            compact = _compact_tree(tree_text)
+            sections.append(f"---SHOW:{show_folder_name}---\n{compact}")
+            cache_parts += (show_folder_name, _normalize_tree_text(compact))
+
+        return _TV_BATCH_PROMPT_TEMPLATE.format(sections="\n".join(sections)), "\0".join(cache_parts)
+
+    def _parse_tv_show_response(self, response_text: str, show_folder_name: str) -> OrganizationPlan:
+        """Parse AI response for TV show organization."""
+        return self._parse_response(response_text, name_field='show_name', fallback_name=show_folder_name, is_tv=True)
+
+    def _parse_movie_response(self, response_text: str, movies_folder_name: str) -> OrganizationPlan:
+        """Parse AI response for movie collection organization."""
+        return self._parse_response(response_text, name_field='collection_name', fallback_name=movies_folder_name,
+                                    is_tv=False)
+
+    def _parse_response(self, response_text: str, *, name_field: str, fallback_name: str,
+                        is_tv: bool) -> OrganizationPlan:
+        """
+        Parse an AI response holding one organization plan.
+
+        Args:
+            response_text: Raw model response
+            name_field: JSON key holding the show or collection name
+            fallback_name: Name used when the response doesn't provide one
+            is_tv: Whether the response is for a TV show (movie plans carry no year)
+
+        Returns:
+            OrganizationPlan built from the response
+        """
+        try:
+            logger.debug("Full AI response text: %s", response_text)
+
+            # Extract and decode the JSON in the response
+            try:
+                json_text, data = _extract_json_object(response_text)
             except json.JSONDecodeError as json_err:
-                print(f"JSON decode error: {json_err}")
-                print(f"Problematic JSON around error: {json_text[max(0, json_err.pos-100):json_err.pos+100]}")
+                logger.warning("JSON decode error: %s", json_err)
+                logger.debug("Problematic JSON around error: %s",
+                             json_err.doc[max(0, json_err.pos-100):json_err.pos+100])
                 raise
 
-            # Parse operations into suggestions
-            suggestions = []
-            for op in data.get('operations', []):
-                if op['operation'] == 'create_directory':
-                    suggestions.append(OrganizationSuggestion(
-                        source_path="",
-                        destination_path=op['destination_path'],
-                        operation='create_directory',
-                        confidence=1.0,
-                        reason=op['reason']
-                    ))
-                elif op['operation'] == 'move':
-                    suggestions.append(OrganizationSuggestion(
-                        source_path=op['source_path'],
-                        destination_path=op['destination_path'],
-                        operation='move',
-                        confidence=op.get('confidence', 0.8),
-                        reason=op['reason']
-                    ))
-
-            return OrganizationPlan(
-                show_name=data.get('collection_name', movies_folder_name),
-                year=None,
-                suggestions=suggestions,
-                summary=data.get('summary', ''),
-                warnings=data.get('warnings', [])
-            )
+            if json_text is None:
+                logger.warning("No JSON found in response: %.1000s", response_text)
+                raise ValueError("No valid JSON found in AI response")
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Extracted JSON text length: %d", len(json_text))
+                logger.debug("Raw JSON response (first 500 chars): %s", json_text[:500])
+                logger.debug("Raw JSON response (last 500 chars): %s", json_text[-500:])
+
+            return self._plan_from_data(data, name_field=name_field, fallback_name=fallback_name, is_tv=is_tv)
 
         except (json.JSONDecodeError, KeyError) as e:
-            print(f"JSON parsing failed: {str(e)}")
-            print(f"Full response that failed: {response_text}")
+            logger.warning("JSON parsing failed: %s", e)
+            logger.debug("Full response that failed: %s", response_text)
             raise ValueError(f"Failed to parse AI response: {str(e)}")
 
+    def _plan_from_data(self, data: Dict[str, Any], *, name_field: str, fallback_name: str,
+                        is_tv: bool) -> OrganizationPlan:
+        """
+        Build an organization plan from a decoded plan object.
+
+        Raises:
+            KeyError: If an operation lacks a required field
+        """
+        # Parse operations into suggestions
+        suggestions = []
+        for op in data.get('operations', []):
+            suggestion = self._suggestion_from_operation(op)
+            if suggestion:
+                suggestions.append(suggestion)
+
+        return OrganizationPlan(
+            show_name=data.get(name_field, fallback_name),
+            year=data.get('year') if is_tv else None,
+            suggestions=suggestions,
+            summary=data.get('summary', ''),
+            warnings=data.get('warnings', [])
+        )
+
+    def _suggestion_from_operation(self, op: Dict[str, Any]) -> Optional[OrganizationSuggestion]:
+        """Convert one operation object from an AI response into a suggestion."""
+        if op['operation'] == 'create_directory':
+            return OrganizationSuggestion(
+                source_path="",
+                destination_path=op['destination_path'],
+                operation='create_directory',
+                confidence=1.0,
+                reason=op['reason']
+            )
+        elif op['operation'] == 'move':
+            return OrganizationSuggestion(
+                source_path=op['source_path'],
+                destination_path=op['destination_path'],
+                operation='move',
+                confidence=op.get('confidence', 0.8),
+                reason=op['reason']
+            )
+
+        return None
+
+    def _parse_tv_show_batch_response(self, response_text: str) -> Dict[str, OrganizationPlan]:
+        """
+        Parse a batched AI response into plans keyed by show folder name.
 
+        A malformed entry is left out, so only its show is retried on its own.
+        """
+        try:
+            json_text, data = _extract_json_object(response_text, opener='[')
+        except json.JSONDecodeError as e:
+            logger.warning("JSON parsing failed: %s", e)
+            raise ValueError(f"Failed to parse AI response: {str(e)}")
+
+        if json_text is None:
+            logger.warning("No JSON array found in response: %.1000s", response_text)
+            raise ValueError("No valid JSON array found in AI response")
+
+        plans = {}
+        for entry in data:
+            show_folder_name = entry.get('show_folder') if isinstance(entry, dict) else None
+            if not show_folder_name:
+                continue
+            try:
+                plans[show_folder_name] = self._plan_from_data(entry, name_field='show_name',
+                                                               fallback_name=show_folder_name, is_tv=True)
+            except (KeyError, TypeError, AttributeError) as e:
+                logger.warning("Skipping malformed batch entry for %s: %s", show_folder_name, e)
+
+        return plans
 
     def validate_suggestions(self, plan: OrganizationPlan, base_path: Path) -> Tuple[List[OrganizationSuggestion], List[str]]:
         """
@@ -422,57 +1264,105 @@ Analyze the structure and provide your organization suggestions:
             Tuple of (valid_suggestions, validation_errors)
         """
         valid_suggestions = []
-        errors = []
+        validation_errors = []
+        # Absolute, so listed entries and the plan's paths compare equal
+        base_path = Path(base_path).resolve()
+
+        # Directories this plan creates, for checking move destinations
+        created_dirs = {
+            base_path / s.destination_path
+            for s in plan.suggestions
+            if s.operation == 'create_directory'
+        }
+
+        # List each directory the plan touches once instead of stat'ing every path
+        checked_paths = []
+        for s in plan.suggestions:
+            if s.operation == 'create_directory':
+                checked_paths.append(base_path / s.destination_path)
+            elif s.operation == 'move':
+                checked_paths.append(base_path / s.source_path)
+                checked_paths.append((base_path / s.destination_path).parent)
+        existing, listed_dirs = self._existing_paths(checked_paths)
+
+        def exists(path: Path) -> bool:
+            # The nearest listed ancestor shows whether the path, or a folder on the
+            # way to it, is missing; only paths below unlisted folders need a stat
+            child = path
+            for ancestor in path.parents:
+                if ancestor in listed_dirs:
+                    if child not in existing:
+                        return False
+                    if child == path:
+                        return True
+                    break
+                child = ancestor
+            return path.exists()
 
         for suggestion in plan.suggestions:
             if suggestion.operation == 'create_directory':
                 # Check if directory already exists
                 dest_path = base_path / suggestion.destination_path
-                if dest_path.exists():
-                    errors.append(f"Directory already exists: {suggestion.destination_path}")
+                if exists(dest_path):
+                    validation_errors.append(f"Directory already exists: {suggestion.destination_path}")
                 else:
                     valid_suggestions.append(suggestion)
 
             elif suggestion.operation == 'move':
                 # Check if source exists
                 source_path = base_path / suggestion.source_path
-                if not source_path.exists():
-                    errors.append(f"Source file not found: {suggestion.source_path}")
+                if not exists(source_path):
+                    validation_errors.append(f"Source file not found: {suggestion.source_path}")
                     continue
 
                 # Check if destination parent directory would exist
                 dest_path = base_path / suggestion.destination_path
-                if not dest_path.parent.exists():
-                    # This is okay if we're creating the directory in the same plan
-                    create_ops = [s for s in plan.suggestions if s.operation == 'create_directory']
-                    parent_will_be_created = any(
-                        str(dest_path.parent).startswith(str(base_path / s.destination_path))
-                        for s in create_ops
+                if not exists(dest_path.parent):
+                    # This is okay if we're creating the directory (or one of its ancestors) in the same plan
+                    parent_will_be_created = dest_path.parent in created_dirs or any(
+                        parent in created_dirs for parent in dest_path.parent.parents
                     )
                     if not parent_will_be_created:
-                        errors.append(f"Destination directory doesn't exist: {dest_path.parent}")
+                        validation_errors.append(f"Destination directory doesn't exist: {dest_path.parent}")
                         continue
 
                 valid_suggestions.append(suggestion)
 
-        return valid_suggestions, errors
+        return valid_suggestions, validation_errors
+
+    @staticmethod
+    def _existing_paths(paths: List[Path]) -> Tuple[Set[Path], Set[Path]]:
+        """
+        Find which of the given paths exist by listing their parent directories.
+
+        Each distinct parent is read with a single os.scandir call, so checking
+        many files in the same folder costs one syscall rather than one stat each.
+
+        Args:
+            paths: Paths to check
+
+        Returns:
+            Tuple of (entries found in the listed directories, directories that
+            could be listed); a path whose parent couldn't be listed is in neither
+        """
+        existing = set()
+        listed_dirs = set()
+        for directory in {path.parent for path in paths}:
+            try:
+                with os.scandir(directory) as entries:
+                    existing.update(directory / entry.name for entry in entries)
+            except OSError:
+                continue
+            listed_dirs.add(directory)
+        return existing, listed_dirs
 
     def test_connection(self) -> bool:
         """Test if the AI connection is working."""
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents="Hello, please respond with 'OK' if you can understand this message.",
-                config=types.GenerateContentConfig(
-                    temperature=0.1,
-                    max_output_tokens=100
-                )
+            response = self._generate(
+                "Hello, please respond with 'OK' if you can understand this message.",
+                config=self._TEST_CONFIG
             )
             return "ok" in response.text.lower()
         except Exception:
             return False
-
-    def __del__(self):
-        """Cleanup when the organizer is destroyed."""
-        if hasattr(self, 'client'):
-            self.client.close()
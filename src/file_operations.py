@@ -7,17 +7,209 @@ Original filenames are always preserved - only directory structure changes.
 """
 
 import os
+import errno
+import functools
+import itertools
+import re
 import shutil
+import stat
+import sys
 import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+if sys.platform.startswith('linux'):
+    import fcntl
+else:
+    fcntl = None
+
 from ai_organizer import OrganizationPlan, OrganizationSuggestion
+from tree_generator import ListingCache
+
+try:
+    # Optional C-accelerated encoder/decoder for reports and the backup log
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        """Serialize obj to compact JSON text."""
+        return orjson.dumps(obj).decode('utf-8')
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> str:
+        """Serialize obj to compact JSON text."""
+        return json.dumps(obj, separators=(',', ':'))
+
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+
+def _scan_directory_usage(directory: str,
+                          listing_cache: Optional[ListingCache] = None) -> Tuple[int, int, List[str]]:
+    """
+    List one directory for get_disk_usage.
+
+    DirEntry objects carry the file type from the directory listing, so only
+    files need a stat() for their size. With a listing cache, directories
+    left unchanged since the last scan are read from it without any stat()
+    calls. Symlinks are skipped and an unreadable directory counts as empty.
+
+    Returns:
+        Tuple of (total file size, file count, subdirectory paths)
+    """
+    total_size = 0
+    file_count = 0
+    subdirs = []
+    try:
+        if listing_cache is not None:
+            entries = listing_cache.scandir(directory)
+        else:
+            with os.scandir(directory) as it:
+                entries = list(it)
+    except PermissionError:
+        return total_size, file_count, subdirs
+
+    for entry in entries:
+        # Symlinks are skipped, so the remaining checks never follow one
+        if entry.is_symlink():
+            continue
+        if entry.is_file():
+            total_size += entry.stat().st_size
+            file_count += 1
+        elif entry.is_dir():
+            subdirs.append(entry.path)
+
+    return total_size, file_count, subdirs
+
+
+# Preview markers for low (<= 0.6), medium and high (> 0.8) confidence moves
+_CONFIDENCE_INDICATORS = ("🔴", "🟡", "🟢")
+
+# Append-only log of moves, one JSON object per line, used by undo
+BACKUP_LOG_NAME = "backup.jsonl"
+
+
+def _read_last_line(path: Path, block_size: int = 4096) -> Tuple[Optional[str], int]:
+    """
+    Read the last non-empty line of a file by seeking backwards from the end.
+
+    Returns:
+        Tuple of (line without newline or None if the file is empty, offset the line starts at)
+    """
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+            content = data.rstrip(b"\n")
+            newline = content.rfind(b"\n")
+            if newline != -1:
+                return content[newline + 1:].decode('utf-8'), pos + newline + 1
+
+    content = data.rstrip(b"\n")
+    if not content:
+        return None, 0
+    return content.decode('utf-8'), 0
+
+
+# FICLONE ioctl from linux/fs.h: make the destination share the source's data extents
+_FICLONE = 0x40049409
+
+# (source device, destination device) pairs where FICLONE has been refused
+_NO_REFLINK_DEVICES = set()
+
+
+def _reflink_move(source: str, destination: str) -> bool:
+    """
+    Move a file by cloning it with FICLONE and deleting the original.
+
+    rename() fails with EXDEV between mount points even when they sit on the
+    same Btrfs/XFS filesystem (bind mounts, subvolumes); a reflink clone
+    there takes the same constant time as a rename instead of copying every
+    byte. Returns False, leaving both paths untouched, if cloning isn't possible.
+    """
+    if fcntl is None:
+        return False
+
+    try:
+        devices = (os.stat(source).st_dev, os.stat(os.path.dirname(destination)).st_dev)
+    except OSError:
+        return False
+    if devices in _NO_REFLINK_DEVICES:
+        return False
+
+    try:
+        with open(source, 'rb') as src, open(destination, 'xb') as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                cloned = True
+            except OSError:
+                cloned = False
+    except OSError:
+        return False
+
+    if not cloned:
+        _NO_REFLINK_DEVICES.add(devices)
+        os.unlink(destination)
+        return False
+
+    shutil.copystat(source, destination)
+    os.unlink(source)
+    return True
+
 
+def _move(source: str, destination: str):
+    """
+    Move a file, renaming in place when both paths are on the same filesystem.
 
-@dataclass
+    os.rename is a single syscall. When it fails with EXDEV the file is
+    reflinked if the filesystem allows it, and copied by shutil.move otherwise.
+    """
+    try:
+        os.rename(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        if not _reflink_move(source, destination):
+            shutil.move(source, destination)
+
+
+def _subtree_usage(directory: str, listing_cache: Optional[ListingCache] = None) -> Tuple[int, int, int]:
+    """
+    Total up everything below a directory.
+
+    Returns:
+        Tuple of (total file size, file count, directory count)
+    """
+    total_size = 0
+    file_count = 0
+    directory_count = 0
+    stack = [directory]
+    while stack:
+        size, files, subdirs = _scan_directory_usage(stack.pop(), listing_cache)
+        total_size += size
+        file_count += files
+        directory_count += len(subdirs)
+        stack.extend(subdirs)
+
+    return total_size, file_count, directory_count
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get regular instances.
+# OperationResult has field defaults, so __slots__ can't be declared by hand.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class OperationResult:
     """Result of a file system operation."""
     success: bool
@@ -28,7 +220,7 @@ class OperationResult:
     bytes_moved: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ExecutionReport:
     """Complete report of organization execution."""
     plan_name: str
@@ -45,7 +237,11 @@ class ExecutionReport:
 class FileOperations:
     """Handles safe file system operations for media organization."""
 
-    def __init__(self, base_path: str, dry_run: bool = True, backup_enabled: bool = True):
+    # Plans with fewer moves than this run them on the calling thread
+    PARALLEL_MOVE_THRESHOLD = 8
+
+    def __init__(self, base_path: str, dry_run: bool = True, backup_enabled: bool = True,
+                 max_workers: Optional[int] = None, listing_cache: Optional[ListingCache] = None):
         """
         Initialize file operations handler.
 
@@ -53,13 +249,31 @@ class FileOperations:
             base_path: Base path for all operations
             dry_run: If True, only simulate operations without actual changes
             backup_enabled: If True, create backup information before moves
+            max_workers: Threads used to run moves concurrently (1 disables parallel moves)
+            listing_cache: Stored directory listings reused by get_disk_usage (None always reads the disk)
         """
-        self.base_path = Path(base_path)
+        # Resolving strictly doubles as the existence check, and later joins
+        # start from a canonical absolute path
+        try:
+            self.base_path = Path(base_path).resolve(strict=True)
+        except FileNotFoundError:
+            raise ValueError(f"Base path does not exist: {base_path}")
+        self._base_path_str = str(self.base_path)
         self.dry_run = dry_run
         self.backup_enabled = backup_enabled
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.listing_cache = listing_cache
+        self._backup_lock = threading.Lock()
+        self._backup_fp = None
+        # Start time of the running plan, stamped on its backup entries
+        self._backup_timestamp: Optional[str] = None
 
-        if not self.base_path.exists():
-            raise ValueError(f"Base path does not exist: {base_path}")
+        # Highest "name.NN.ext" counter handed out per (folder, name, extension) during a plan
+        self._unique_counters: Dict[Tuple[Path, str, str], int] = {}
+        self._unique_lock = threading.Lock()
+
+        # Destination folders already created by execute_plan
+        self._created_dirs = set()
 
     def execute_plan(self, plan: OrganizationPlan, plan_name: str = "") -> ExecutionReport:
         """
@@ -86,22 +300,52 @@ class FileOperations:
             dry_run=self.dry_run
         )
 
-        print(f"{'[DRY RUN] ' if self.dry_run else ''}Executing plan: {report.plan_name}")
-        print(f"Total operations: {report.total_operations}")
+        self._unique_counters.clear()
+        self._backup_timestamp = report.start_time.isoformat()
+
+        logger.info("%sExecuting plan: %s", '[DRY RUN] ' if self.dry_run else '', report.plan_name)
+        logger.info("Total operations: %d", report.total_operations)
+
+        # Bucket operations so directory creation runs first, parents before children
+        creates = []
+        moves = []
+        others = []
+        for s in plan.suggestions:
+            if s.operation == 'create_directory':
+                creates.append(s)
+            elif s.operation == 'move':
+                moves.append(s)
+            else:
+                others.append(s)
+        creates.sort(key=lambda s: s.destination_path.count('/'))
+
+        # Folders that moved files land in, created together before the first move
+        move_parents = None
+        if not self.dry_run:
+            move_parents = {(self.base_path / s.destination_path).parent for s in moves}
 
-        # Sort operations to do directory creation first
-        sorted_suggestions = sorted(
-            plan.suggestions,
-            key=lambda x: (0 if x.operation == 'create_directory' else 1, x.destination_path)
-        )
+        # Moves overlap well on network storage, so large plans run them on a thread pool
+        parallel_moves = (not self.dry_run and self.max_workers > 1
+                          and len(moves) >= self.PARALLEL_MOVE_THRESHOLD)
+        pending_moves = []
+
+        # Existence and size of every source, from one listing per source folder
+        source_stats = self._prefetch_source_stats(moves)
 
-        for i, suggestion in enumerate(sorted_suggestions, 1):
-            print(f"Operation {i}/{report.total_operations}: {suggestion.operation}")
+        for i, suggestion in enumerate(itertools.chain(creates, moves, others), 1):
+            logger.debug("Operation %d/%d: %s", i, report.total_operations, suggestion.operation)
+
+            if suggestion.operation == 'move' and move_parents:
+                self._ensure_directories(move_parents)
+                move_parents = None
 
             if suggestion.operation == 'create_directory':
                 result = self._create_directory(suggestion)
             elif suggestion.operation == 'move':
-                result = self._move_file(suggestion)
+                if parallel_moves:
+                    pending_moves.append(suggestion)
+                    continue
+                result = self._move_file(suggestion, source_stats.pop(suggestion.source_path, None))
             else:
                 result = OperationResult(
                     success=False,
@@ -111,27 +355,56 @@ class FileOperations:
                     error_message=f"Unknown operation: {suggestion.operation}"
                 )
 
-            report.results.append(result)
+            self._record_result(report, result)
 
-            if result.success:
-                report.successful_operations += 1
-                if result.bytes_moved:
-                    report.total_bytes_moved += result.bytes_moved
-            else:
-                report.failed_operations += 1
-                print(f"  ❌ Failed: {result.error_message}")
+        for result in self._move_files_parallel(pending_moves, source_stats):
+            self._record_result(report, result)
 
         report.end_time = datetime.now()
         self._save_execution_report(report)
 
         return report
 
+    def _record_result(self, report: ExecutionReport, result: OperationResult):
+        """Add an operation result to the report and update its counters."""
+        report.results.append(result)
+
+        if result.success:
+            report.successful_operations += 1
+            if result.bytes_moved:
+                report.total_bytes_moved += result.bytes_moved
+        else:
+            report.failed_operations += 1
+            logger.warning("  ❌ Failed: %s", result.error_message)
+
+    def _move_files_parallel(self, moves: List[OrganizationSuggestion],
+                             source_stats: Dict[str, os.stat_result]) -> List[OperationResult]:
+        """
+        Run moves on a thread pool and return their results in plan order.
+
+        Moves that target the same destination run one after another in a
+        single task, so overwrite and unique-name decisions never race.
+        """
+        if not moves:
+            return []
+
+        groups: Dict[str, List[OrganizationSuggestion]] = {}
+        for suggestion in moves:
+            groups.setdefault(suggestion.destination_path, []).append(suggestion)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            batches = executor.map(
+                lambda group: [self._move_file(s, source_stats.pop(s.source_path, None)) for s in group],
+                groups.values()
+            )
+            return [result for batch in batches for result in batch]
+
     def _create_directory(self, suggestion: OrganizationSuggestion) -> OperationResult:
         """Create a directory."""
         dest_path = self.base_path / suggestion.destination_path
 
         if self.dry_run:
-            print(f"  [DRY RUN] Would create directory: {dest_path}")
+            logger.info("  [DRY RUN] Would create directory: %s", dest_path)
             return OperationResult(
                 success=True,
                 operation='create_directory',
@@ -141,7 +414,7 @@ class FileOperations:
 
         try:
             if dest_path.exists():
-                print(f"  ℹ️  Directory already exists: {dest_path}")
+                logger.info("  ℹ️  Directory already exists: %s", dest_path)
                 return OperationResult(
                     success=True,
                     operation='create_directory',
@@ -150,7 +423,7 @@ class FileOperations:
                 )
 
             dest_path.mkdir(parents=True, exist_ok=True)
-            print(f"  ✅ Created directory: {dest_path}")
+            logger.info("  ✅ Created directory: %s", dest_path)
 
             return OperationResult(
                 success=True,
@@ -168,61 +441,111 @@ class FileOperations:
                 error_message=str(e)
             )
 
-    def _move_file(self, suggestion: OrganizationSuggestion) -> OperationResult:
-        """Move a file from source to destination while preserving original filename."""
-        source_path = self.base_path / suggestion.source_path
-        dest_path = self.base_path / suggestion.destination_path
+    def _prefetch_source_stats(self, moves: List[OrganizationSuggestion]) -> Dict[str, os.stat_result]:
+        """
+        Stat the sources of a set of moves with one directory listing per source folder.
 
-        # Validate source exists
-        if not source_path.exists():
+        Callers pop each result as its source is moved, so a plan that moves the
+        same source twice stats it again instead of trusting a stale result.
+
+        Returns:
+            Stat results keyed by each suggestion's source_path; sources not
+            found in their folder's listing are left out and checked individually
+        """
+        wanted: Dict[str, Dict[str, List[str]]] = {}
+        for suggestion in moves:
+            parent, name = os.path.split(os.path.join(self._base_path_str, suggestion.source_path))
+            wanted.setdefault(parent, {}).setdefault(name, []).append(suggestion.source_path)
+
+        source_stats = {}
+        for parent, names in wanted.items():
+            try:
+                with os.scandir(parent) as entries:
+                    for entry in entries:
+                        keys = names.get(entry.name)
+                        if not keys:
+                            continue
+                        try:
+                            entry_stat = entry.stat()
+                        except OSError:
+                            continue  # e.g. a dangling symlink; the move reports it
+                        for key in keys:
+                            source_stats[key] = entry_stat
+            except OSError:
+                continue
+
+        return source_stats
+
+    def _move_file(self, suggestion: OrganizationSuggestion,
+                   source_stat: Optional[os.stat_result] = None) -> OperationResult:
+        """
+        Move a file from source to destination while preserving original filename.
+
+        Args:
+            suggestion: The move to perform
+            source_stat: Stat of the source if already known, saving a lookup
+        """
+        # Plain strings: every call below accepts them, and joining is much
+        # cheaper than building Path objects for each move
+        source_path = os.path.join(self._base_path_str, suggestion.source_path)
+        dest_path = os.path.join(self._base_path_str, suggestion.destination_path)
+
+        # Validate source exists; one stat also gives the type and size
+        try:
+            if source_stat is None:
+                source_stat = os.stat(source_path)
+        except FileNotFoundError:
             return OperationResult(
                 success=False,
                 operation='move',
-                source_path=str(source_path),
-                destination_path=str(dest_path),
+                source_path=source_path,
+                destination_path=dest_path,
                 error_message=f"Source file not found: {source_path}"
             )
 
         # Get file size for reporting
-        file_size = source_path.stat().st_size if source_path.is_file() else 0
+        file_size = source_stat.st_size if stat.S_ISREG(source_stat.st_mode) else 0
 
         if self.dry_run:
-            print(f"  [DRY RUN] Would move: {source_path} -> {dest_path}")
+            logger.info("  [DRY RUN] Would move: %s -> %s", source_path, dest_path)
             return OperationResult(
                 success=True,
                 operation='move',
-                source_path=str(source_path),
-                destination_path=str(dest_path),
+                source_path=source_path,
+                destination_path=dest_path,
                 bytes_moved=file_size
             )
 
         try:
-            # Create backup info if enabled
-            if self.backup_enabled:
-                self._create_backup_info(source_path, dest_path)
-
-            # Ensure destination directory exists
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-
             # Check if destination exists
-            if dest_path.exists():
-                if self._should_overwrite(source_path, dest_path):
-                    print(f"  ⚠️  Overwriting existing file: {dest_path}")
-                    dest_path.unlink()
+            try:
+                dest_stat = os.stat(dest_path)
+            except OSError:
+                dest_stat = None
+
+            if dest_stat is not None:
+                if self._should_overwrite(source_stat, dest_stat):
+                    logger.info("  ⚠️  Overwriting existing file: %s", dest_path)
+                    os.unlink(dest_path)
                 else:
                     # Create unique name
-                    dest_path = self._get_unique_destination(dest_path)
-                    print(f"  ℹ️  Using alternative name: {dest_path}")
+                    dest_path = str(self._get_unique_destination(Path(dest_path)))
+                    logger.info("  ℹ️  Using alternative name: %s", dest_path)
 
             # Perform the move
-            shutil.move(str(source_path), str(dest_path))
-            print(f"  ✅ Moved: {source_path.name} -> {dest_path}")
+            _move(source_path, dest_path)
+
+            # Record it for undo only once it happened, under the final destination name
+            if self.backup_enabled:
+                with self._backup_lock:
+                    self._create_backup_info(source_path, dest_path, source_stat)
+            logger.info("  ✅ Moved: %s -> %s", os.path.basename(source_path), dest_path)
 
             return OperationResult(
                 success=True,
                 operation='move',
-                source_path=str(source_path),
-                destination_path=str(dest_path),
+                source_path=source_path,
+                destination_path=dest_path,
                 bytes_moved=file_size
             )
 
@@ -230,61 +553,98 @@ class FileOperations:
             return OperationResult(
                 success=False,
                 operation='move',
-                source_path=str(source_path),
-                destination_path=str(dest_path),
+                source_path=source_path,
+                destination_path=dest_path,
                 error_message=str(e)
             )
 
-    def _should_overwrite(self, source_path: Path, dest_path: Path) -> bool:
-        """Determine if destination file should be overwritten."""
-        if not dest_path.exists():
-            return False
-
-        # Compare file sizes - keep larger file
-        source_size = source_path.stat().st_size
-        dest_size = dest_path.stat().st_size
+    def _ensure_directories(self, directories: Iterable[Path]):
+        """
+        Create each directory once, parents before children.
 
-        if source_size > dest_size:
-            return True
+        Failures are left for the moves into that directory to report.
+        """
+        for directory in sorted(directories, key=lambda d: len(d.parts)):
+            if directory in self._created_dirs:
+                continue
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(directory)
+            except OSError:
+                pass
+
+    def _should_overwrite(self, source_stat: os.stat_result, dest_stat: os.stat_result) -> bool:
+        """
+        Determine if destination file should be overwritten.
 
-        # If same size, keep newer file
-        if source_size == dest_size:
-            source_mtime = source_path.stat().st_mtime
-            dest_mtime = dest_path.stat().st_mtime
-            return source_mtime > dest_mtime
+        Keeps the larger file, or the newer one if both are the same size.
+        Takes the stat results the caller already has, so no extra syscalls are made.
+        """
+        if source_stat.st_size != dest_stat.st_size:
+            return source_stat.st_size > dest_stat.st_size
 
-        return False
+        return source_stat.st_mtime > dest_stat.st_mtime
 
     def _get_unique_destination(self, dest_path: Path) -> Path:
-        """Generate a unique destination path if file already exists."""
-        counter = 1
+        """
+        Generate a unique destination path if file already exists.
+
+        The parent directory is listed once to find the highest existing
+        ``name.NN.ext`` counter; later conflicts for the same name during the
+        plan continue from the remembered counter without listing again.
+        """
         base_name = dest_path.stem
         extension = dest_path.suffix
         parent = dest_path.parent
+        key = (parent, base_name, extension)
+
+        with self._unique_lock:
+            counter = self._unique_counters.get(key)
+            if counter is None:
+                pattern = re.compile(re.escape(base_name) + r'\.(\d+)' + re.escape(extension))
+                counter = 0
+                try:
+                    with os.scandir(parent) as entries:
+                        for entry in entries:
+                            match = pattern.fullmatch(entry.name)
+                            if match:
+                                counter = max(counter, int(match.group(1)))
+                except OSError:
+                    pass
 
-        while True:
-            new_name = f"{base_name}.{counter:02d}{extension}"
-            new_path = parent / new_name
-            if not new_path.exists():
-                return new_path
             counter += 1
+            self._unique_counters[key] = counter
 
-    def _create_backup_info(self, source_path: Path, dest_path: Path):
-        """Create backup information for file operations."""
-        backup_dir = self.base_path / ".organize_backup"
-        backup_dir.mkdir(exist_ok=True)
+        return parent / f"{base_name}.{counter:02d}{extension}"
+
+    def _create_backup_info(self, source_path: str, dest_path: str, source_stat: os.stat_result):
+        """Append backup information for a file operation to the backup log."""
+        if self._backup_fp is None:
+            backup_dir = self.base_path / ".organize_backup"
+            backup_dir.mkdir(exist_ok=True)
+            # Line buffered so every entry reaches the file as soon as its move is done
+            self._backup_fp = open(backup_dir / BACKUP_LOG_NAME, 'a', encoding='utf-8', buffering=1)
 
         backup_info = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._backup_timestamp or datetime.now().isoformat(),
             "operation": "move",
-            "source": str(source_path),
-            "destination": str(dest_path),
-            "source_size": source_path.stat().st_size if source_path.exists() else 0
+            "source": source_path,
+            "destination": dest_path,
+            "source_size": source_stat.st_size
         }
 
-        backup_file = backup_dir / f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(backup_file, 'w') as f:
-            json.dump(backup_info, f, indent=2)
+        self._backup_fp.write(_json_dumps(backup_info) + "\n")
+
+    def close(self):
+        """Close the backup log if it is open."""
+        if self._backup_fp is not None:
+            self._backup_fp.close()
+            self._backup_fp = None
+
+    def __del__(self):
+        """Cleanup when the handler is destroyed."""
+        if hasattr(self, '_backup_fp'):
+            self.close()
 
     def _save_execution_report(self, report: ExecutionReport):
         """Save execution report to file."""
@@ -294,8 +654,8 @@ class FileOperations:
         timestamp = report.start_time.strftime('%Y%m%d_%H%M%S')
         report_file = reports_dir / f"execution_report_{timestamp}.json"
 
-        # Convert report to dict for JSON serialization
-        report_dict = {
+        # Summary fields; results are streamed below instead of building one big dict
+        header = {
             "plan_name": report.plan_name,
             "start_time": report.start_time.isoformat(),
             "end_time": report.end_time.isoformat() if report.end_time else None,
@@ -303,24 +663,28 @@ class FileOperations:
             "successful_operations": report.successful_operations,
             "failed_operations": report.failed_operations,
             "total_bytes_moved": report.total_bytes_moved,
-            "dry_run": report.dry_run,
-            "results": [
-                {
+            "dry_run": report.dry_run
+        }
+
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write("{\n")
+            for key, value in header.items():
+                f.write(f"  {_json_dumps(key)}: {_json_dumps(value)},\n")
+
+            f.write('  "results": [')
+            for i, r in enumerate(report.results):
+                f.write(",\n    " if i else "\n    ")
+                f.write(_json_dumps({
                     "success": r.success,
                     "operation": r.operation,
                     "source_path": r.source_path,
                     "destination_path": r.destination_path,
                     "error_message": r.error_message,
                     "bytes_moved": r.bytes_moved
-                }
-                for r in report.results
-            ]
-        }
-
-        with open(report_file, 'w') as f:
-            json.dump(report_dict, f, indent=2)
+                }))
+            f.write("\n  ]\n}\n" if report.results else "]\n}\n")
 
-        print(f"\nExecution report saved: {report_file}")
+        logger.info("Execution report saved: %s", report_file)
 
     def undo_last_operation(self) -> bool:
         """
@@ -329,37 +693,35 @@ class FileOperations:
         Returns:
             True if undo was successful, False otherwise
         """
-        backup_dir = self.base_path / ".organize_backup"
-        if not backup_dir.exists():
-            print("No backup information found")
-            return False
-
-        # Find the most recent backup file
-        backup_files = sorted(backup_dir.glob("backup_*.json"), reverse=True)
-        if not backup_files:
-            print("No backup files found")
+        backup_log = self.base_path / ".organize_backup" / BACKUP_LOG_NAME
+        if not backup_log.exists():
+            logger.warning("No backup information found")
             return False
 
-        latest_backup = backup_files[0]
-
         try:
-            with open(latest_backup, 'r') as f:
-                backup_info = json.load(f)
+            # The most recent operation is the last line of the log
+            line, line_start = _read_last_line(backup_log)
+            if line is None:
+                logger.warning("No backup entries found")
+                return False
+
+            backup_info = _json_loads(line)
 
             source = Path(backup_info['source'])
             destination = Path(backup_info['destination'])
 
             if backup_info['operation'] == 'move' and destination.exists():
                 # Move the file back
-                shutil.move(str(destination), str(source))
-                print(f"Undone: {destination} -> {source}")
+                _move(str(destination), str(source))
+                logger.info("Undone: %s -> %s", destination, source)
 
-                # Remove the backup file
-                latest_backup.unlink()
+                # Drop the entry from the log
+                with self._backup_lock:
+                    os.truncate(backup_log, line_start)
                 return True
 
         except Exception as e:
-            print(f"Failed to undo operation: {e}")
+            logger.warning("Failed to undo operation: %s", e)
             return False
 
         return False
@@ -378,27 +740,28 @@ class FileOperations:
             path = self.base_path
 
         removed_count = 0
-
-        try:
-            for item in path.iterdir():
-                if item.is_dir():
-                    # Recursively clean subdirectories first
-                    removed_count += self.cleanup_empty_directories(item)
-
-                    # Try to remove this directory if it's empty
-                    try:
-                        if not any(item.iterdir()):  # Directory is empty
-                            if not self.dry_run:
-                                item.rmdir()
-                                print(f"  🗑️  Removed empty directory: {item}")
-                            else:
-                                print(f"  [DRY RUN] Would remove empty directory: {item}")
-                            removed_count += 1
-                    except OSError:
-                        pass  # Directory not empty or permission denied
-
-        except PermissionError:
-            pass
+        top = os.fspath(path)
+        removed = set()
+
+        # Bottom-up walk: every directory is visited after its children, so a
+        # folder whose subfolders were all just removed is removed too
+        for root, dirs, files in os.walk(top, topdown=False):
+            if root == top or files:
+                continue
+            if any(os.path.join(root, d) not in removed for d in dirs):
+                continue
+
+            if not self.dry_run:
+                try:
+                    os.rmdir(root)
+                except OSError:
+                    continue  # Directory not empty or permission denied
+                removed.add(root)
+                self._created_dirs.discard(Path(root))
+                logger.info("  🗑️  Removed empty directory: %s", root)
+            else:
+                logger.info("  [DRY RUN] Would remove empty directory: %s", root)
+            removed_count += 1
 
         return removed_count
 
@@ -415,16 +778,18 @@ class FileOperations:
         if path is None:
             path = self.base_path
 
-        total_size = 0
-        file_count = 0
-        directory_count = 0
+        total_size, file_count, subdirs = _scan_directory_usage(os.fspath(path), self.listing_cache)
+        directory_count = len(subdirs)
 
-        for item in path.rglob('*'):
-            if item.is_file():
-                total_size += item.stat().st_size
-                file_count += 1
-            elif item.is_dir():
-                directory_count += 1
+        # Walk each top-level folder (one per show or movie, typically) on its own
+        # thread: on NFS/SMB every listing and stat waits on the network, and
+        # those waits overlap across threads
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            usage = executor.map(functools.partial(_subtree_usage, listing_cache=self.listing_cache), subdirs)
+            for size, files, directories in usage:
+                total_size += size
+                file_count += files
+                directory_count += directories
 
         return {
             "total_size": total_size,
@@ -444,36 +809,39 @@ class FileOperations:
         Returns:
             String with formatted preview
         """
-        preview = f"Organization Plan Preview: {plan.show_name}\n"
-        preview += "=" * 50 + "\n\n"
+        parts = [f"Organization Plan Preview: {plan.show_name}\n", "=" * 50 + "\n\n"]
 
         if plan.summary:
-            preview += f"Summary: {plan.summary}\n\n"
+            parts.append(f"Summary: {plan.summary}\n\n")
 
         if plan.warnings:
-            preview += "⚠️  Warnings:\n"
+            parts.append("⚠️  Warnings:\n")
             for warning in plan.warnings:
-                preview += f"  - {warning}\n"
-            preview += "\n"
+                parts.append(f"  - {warning}\n")
+            parts.append("\n")
 
-        preview += f"Operations ({len(plan.suggestions)}):\n"
+        parts.append(f"Operations ({len(plan.suggestions)}):\n")
 
-        create_ops = [s for s in plan.suggestions if s.operation == 'create_directory']
-        move_ops = [s for s in plan.suggestions if s.operation == 'move']
+        create_ops = []
+        move_ops = []
+        for s in plan.suggestions:
+            if s.operation == 'create_directory':
+                create_ops.append(s)
+            elif s.operation == 'move':
+                move_ops.append(s)
 
         if create_ops:
-            preview += f"\n📁 Directory Creation ({len(create_ops)}):\n"
+            parts.append(f"\n📁 Directory Creation ({len(create_ops)}):\n")
             for op in create_ops:
-                preview += f"  + Create: {op.destination_path}\n"
+                parts.append(f"  + Create: {op.destination_path}\n")
 
         if move_ops:
-            preview += f"\n📦 File Moves ({len(move_ops)}) - Original filenames preserved:\n"
+            parts.append(f"\n📦 File Moves ({len(move_ops)}) - Original filenames preserved:\n")
             for op in move_ops:
-                confidence_indicator = "🟢" if op.confidence > 0.8 else "🟡" if op.confidence > 0.6 else "🔴"
-                preview += f"  {confidence_indicator} {op.source_path} -> {op.destination_path}\n"
-                preview += f"     Reason: {op.reason} (confidence: {op.confidence:.1%})\n"
+                confidence_indicator = _CONFIDENCE_INDICATORS[(op.confidence > 0.6) + (op.confidence > 0.8)]
+                parts.append(f"  {confidence_indicator} {op.source_path} -> {op.destination_path}\n")
+                parts.append(f"     Reason: {op.reason} (confidence: {op.confidence:.1%})\n")
 
-        total_moves = len([s for s in plan.suggestions if s.operation == 'move'])
-        preview += f"\nTotal files to be moved: {total_moves}\n"
+        parts.append(f"\nTotal files to be moved: {len(move_ops)}\n")
 
-        return preview
+        return "".join(parts)
@@ -8,9 +8,13 @@ Google Gemini AI to intelligently organize movies and TV shows.
 
 import os
 import sys
+import asyncio
+import functools
+import logging
 import click
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import Dict, Iterable, Optional
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.table import Table
@@ -22,28 +26,117 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
-from tree_generator import TreeGenerator
+from tree_generator import ListingCache, TreeGenerator
 from ai_organizer import AIOrganizer
-from file_operations import FileOperations
+from file_operations import BACKUP_LOG_NAME, FileOperations
 
 
-# Load environment variables
-load_dotenv()
-
 # Initialize Rich console
 console = Console()
 
 
+def _write_lines(lines: Iterable[str], buffer_size: int = 64 * 1024):
+    """
+    Write text lines to stdout in chunks of about buffer_size characters.
+
+    Bypasses Rich, which renders every print call separately and writes each
+    line on its own to a terminal; names are printed verbatim, without markup.
+    """
+    chunk = []
+    chunk_size = 0
+    for line in lines:
+        chunk.append(line)
+        chunk_size += len(line)
+        if chunk_size >= buffer_size:
+            sys.stdout.write("".join(chunk))
+            chunk = []
+            chunk_size = 0
+
+    sys.stdout.write("".join(chunk))
+    sys.stdout.flush()
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    """Read an integer setting, warning and using the default when it isn't a number."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return max(minimum, int(value))
+    except ValueError:
+        console.print(f"⚠️  Ignoring invalid {name}={value!r}, using {default}", style="yellow")
+        return default
+
+
+@functools.lru_cache(maxsize=1)
+def _load_settings() -> SimpleNamespace:
+    """
+    Read the .env file and environment settings once per process.
+
+    Every MediaOrganizerCLI created afterwards (one per command, or many when
+    the CLI is driven from a wrapper script) reuses the parsed values.
+    """
+    load_dotenv()
+    return SimpleNamespace(
+        api_key=os.getenv('GEMINI_API_KEY'),
+        movies_path=os.getenv('MOVIES_PATH'),
+        tv_shows_path=os.getenv('TV_SHOWS_PATH'),
+        dry_run=os.getenv('DRY_RUN', 'true').lower() == 'true',
+        backup_enabled=os.getenv('BACKUP_ENABLED', 'true').lower() == 'true',
+        gemini_model=os.getenv('GEMINI_MODEL', 'gemini-1.5-flash'),
+        gemini_concurrency=_env_int('GEMINI_CONCURRENCY', 5, minimum=1),
+        listing_cache_ttl=_env_int('LISTING_CACHE_TTL', 0, minimum=0),
+    )
+
+
+def _fetch_show_plans(organizer: AIOrganizer, show_trees: Dict[str, str], concurrency: int) -> Dict:
+    """
+    Request organization plans for several shows concurrently.
+
+    Prints a line as each show's plan arrives.
+
+    Returns:
+        Mapping of show name to its OrganizationPlan, or to the exception raised for it
+    """
+    async def fetch_all():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(show, tree_text):
+            async with semaphore:
+                try:
+                    return show, await organizer.organize_tv_show_async(tree_text, show)
+                except Exception as e:
+                    return show, e
+
+        plans = {}
+        for done in asyncio.as_completed([fetch(show, tree_text) for show, tree_text in show_trees.items()]):
+            show, plan = await done
+            plans[show] = plan
+            if isinstance(plan, Exception):
+                console.print(f"  ❌ [{len(plans)}/{len(show_trees)}] {show}", style="red")
+            else:
+                console.print(f"  ✅ [{len(plans)}/{len(show_trees)}] {show}")
+        return plans
+
+    return asyncio.run(fetch_all())
+
+
 class MediaOrganizerCLI:
     """Main CLI application class."""
 
     def __init__(self):
-        self.api_key = os.getenv('GEMINI_API_KEY')
-        self.movies_path = os.getenv('MOVIES_PATH')
-        self.tv_shows_path = os.getenv('TV_SHOWS_PATH')
-        self.dry_run = os.getenv('DRY_RUN', 'true').lower() == 'true'
-        self.backup_enabled = os.getenv('BACKUP_ENABLED', 'true').lower() == 'true'
-        self.gemini_model = os.getenv('GEMINI_MODEL', 'gemini-1.5-flash')
+        settings = _load_settings()
+        self.api_key = settings.api_key
+        self.movies_path = settings.movies_path
+        self.tv_shows_path = settings.tv_shows_path
+        self.dry_run = settings.dry_run
+        self.backup_enabled = settings.backup_enabled
+        self.gemini_model = settings.gemini_model
+        self.gemini_concurrency = settings.gemini_concurrency
+        # Persisting directory listings across runs is opt-in
+        self.listing_cache = None
+        if settings.listing_cache_ttl:
+            self.listing_cache = ListingCache(ttl_seconds=settings.listing_cache_ttl)
 
     def validate_setup(self) -> bool:
         """Validate that all required configuration is present."""
@@ -91,6 +184,12 @@ def cli(ctx, dry_run, verbose):
     ctx.obj['dry_run'] = dry_run
     ctx.obj['verbose'] = verbose
 
+    # Per-operation progress from file operations; raw AI responses only when verbose
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger('file_operations').setLevel(logging.DEBUG if verbose else logging.INFO)
+    if verbose:
+        logging.getLogger('ai_organizer').setLevel(logging.DEBUG)
+
     app = MediaOrganizerCLI()
     ctx.obj['app'] = app
 
@@ -169,18 +268,20 @@ def test(ctx):
 @click.pass_context
 def scan(ctx, path, max_depth):
     """Scan and display directory structure for a given path."""
+    app = ctx.obj['app']
     console.print(f"📁 Scanning directory: {path}")
 
     try:
-        generator = TreeGenerator(path)
-        tree = generator.generate_tree(max_depth=max_depth)
+        generator = TreeGenerator(path, listing_cache=app.listing_cache)
 
+        # Print lines as the walk produces them instead of building the tree first
+        analysis = {}
         console.print("\n" + "="*60)
-        console.print(generator.tree_to_text(tree))
+        _write_lines(generator.iter_directory_lines(max_depth=max_depth, analysis=analysis))
+        console.print()
         console.print("="*60)
 
         # Show analysis
-        analysis = generator.analyze_media_content(tree)
 
         table = Table(title="Media Analysis")
         table.add_column("Metric", style="cyan")
@@ -214,7 +315,7 @@ def organize_show(ctx, path, show_name):
     console.print(f"📺 Organizing TV show{'s' if not show_name else f': {show_name}'}")
 
     try:
-        generator = TreeGenerator(path)
+        generator = TreeGenerator(path, listing_cache=app.listing_cache)
 
         if show_name:
             # Organize specific show
@@ -260,26 +361,51 @@ def organize_show(ctx, path, show_name):
         organizer = AIOrganizer(app.api_key, app.gemini_model)
         file_ops = FileOperations(path, dry_run=dry_run, backup_enabled=app.backup_enabled)
 
-        for show in shows_to_process:
-            console.print(f"\n🎬 Processing: {show}")
-
-            # Generate tree for this show
+        # With several shows, request all plans up front so the AI round-trips overlap
+        prefetched_plans = {}
+        if len(shows_to_process) > 1:
             with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
-                task = progress.add_task("Generating directory tree...", total=None)
-                show_tree = generator.generate_single_folder_tree(show)
+                task = progress.add_task("Generating directory trees...", total=None)
+                show_trees = {}
+                for show in shows_to_process:
+                    show_tree = generator.generate_single_folder_tree(show)
+                    if show_tree:
+                        show_trees[show] = generator.tree_to_text(show_tree)
                 progress.update(task, completed=True)
 
-            if not show_tree:
-                console.print(f"❌ Could not access folder: {show}", style="red")
-                continue
+            console.print(f"🤖 Getting AI organization suggestions for {len(show_trees)} shows "
+                          f"({app.gemini_concurrency} at a time)...")
+            prefetched_plans = _fetch_show_plans(organizer, show_trees, app.gemini_concurrency)
 
-            tree_text = generator.tree_to_text(show_tree)
+        for show in shows_to_process:
+            console.print(f"\n🎬 Processing: {show}")
 
-            # Get AI suggestions
-            with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
-                task = progress.add_task("Getting AI organization suggestions...", total=None)
-                plan = organizer.organize_tv_show(tree_text, show)
-                progress.update(task, completed=True)
+            if len(shows_to_process) > 1:
+                plan = prefetched_plans.get(show)
+                if plan is None:
+                    console.print(f"❌ Could not access folder: {show}", style="red")
+                    continue
+                if isinstance(plan, Exception):
+                    console.print(f"❌ Error organizing {show}: {str(plan)}", style="red")
+                    continue
+            else:
+                # Generate tree for this show
+                with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+                    task = progress.add_task("Generating directory tree...", total=None)
+                    show_tree = generator.generate_single_folder_tree(show)
+                    progress.update(task, completed=True)
+
+                if not show_tree:
+                    console.print(f"❌ Could not access folder: {show}", style="red")
+                    continue
+
+                tree_text = generator.tree_to_text(show_tree)
+
+                # Get AI suggestions
+                with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+                    task = progress.add_task("Getting AI organization suggestions...", total=None)
+                    plan = organizer.organize_tv_show(tree_text, show)
+                    progress.update(task, completed=True)
 
             # Show preview
             console.print(Panel(file_ops.preview_plan(plan), title=f"Organization Plan: {show}"))
@@ -325,7 +451,7 @@ def organize_movies(ctx, path):
     console.print(f"🎬 Organizing movies in: {path}")
 
     try:
-        generator = TreeGenerator(path)
+        generator = TreeGenerator(path, listing_cache=app.listing_cache)
 
         # Generate tree for movies
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
@@ -423,10 +549,12 @@ def undo(ctx, path):
 @click.pass_context
 def status(ctx, path):
     """Show status and statistics for media directory."""
+    app = ctx.obj['app']
     console.print(f"📊 Analyzing: {path}")
 
     try:
-        file_ops = FileOperations(path)
+        # Folders listed by a recent scan are totalled from the listing cache
+        file_ops = FileOperations(path, listing_cache=app.listing_cache)
         usage = file_ops.get_disk_usage()
 
         table = Table(title="Directory Statistics")
@@ -444,13 +572,22 @@ def status(ctx, path):
         backup_dir = Path(path) / ".organize_backup"
         reports_dir = Path(path) / ".organize_reports"
 
-        if backup_dir.exists():
-            backup_files = list(backup_dir.glob("backup_*.json"))
-            console.print(f"📁 Backup files: {len(backup_files)}")
+        backup_log = backup_dir / BACKUP_LOG_NAME
+        if backup_log.exists():
+            with open(backup_log, 'r', encoding='utf-8') as f:
+                backup_entries = sum(1 for line in f if line.strip())
+            console.print(f"📁 Backup entries: {backup_entries}")
 
-        if reports_dir.exists():
-            report_files = list(reports_dir.glob("execution_report_*.json"))
-            console.print(f"📋 Execution reports: {len(report_files)}")
+        # Filter the names of one listing instead of compiling and matching a glob
+        try:
+            with os.scandir(reports_dir) as entries:
+                report_count = sum(1 for entry in entries
+                                   if entry.name.startswith("execution_report_") and entry.name.endswith(".json"))
+        except OSError:
+            # Missing or unreadable; there are no reports to count
+            pass
+        else:
+            console.print(f"📋 Execution reports: {report_count}")
 
     except Exception as e:
         console.print(f"❌ Error getting status: {str(e)}", style="red")
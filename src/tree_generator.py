@@ -6,13 +6,36 @@ and folders, which can then be sent to AI for organization suggestions.
 """
 
 import os
+import re
+import stat
+import sys
 import json
+import time
+import atexit
+import sqlite3
+import threading
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+# On macOS, getattrlistbulk returns names, types and sizes without a stat per file
+if sys.platform == 'darwin':
+    try:
+        from _bulkwalk_darwin import scandir_bulk
+    except (ImportError, OSError, AttributeError):
+        scandir_bulk = None
+else:
+    scandir_bulk = None
+
+
+# One instance per file and directory; dataclass(slots=True) drops the per-instance
+# __dict__ but needs Python 3.10, so older interpreters get regular instances
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MediaFile:
     """Represents a media file with metadata."""
     name: str
@@ -24,7 +47,7 @@ class MediaFile:
     is_extra: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DirectoryNode:
     """Represents a directory node in the tree structure."""
     name: str
@@ -35,6 +58,236 @@ class DirectoryNode:
     media_file: Optional[MediaFile] = None
 
 
+_BYTES_PER_MB = 1024 * 1024
+
+
+def _tree_line(prefix: str, node: 'DirectoryNode') -> str:
+    """Format one line of the text tree, in one step with the size for files."""
+    if node.type == 'file' and node.size:
+        return f"{prefix}{node.name} ({node.size / _BYTES_PER_MB:.1f} MB)\n"
+    return f"{prefix}{node.name}\n"
+
+
+def _is_shallow(node: 'DirectoryNode') -> bool:
+    """Whether no child of the node's children has children of its own."""
+    return not any(grandchild.children
+                   for child in node.children if child.children
+                   for grandchild in child.children)
+
+
+def _entry_name(entry: os.DirEntry) -> str:
+    """Sort key for directory entries."""
+    return entry.name
+
+
+def _read_directory(path: Union[str, Path]) -> list:
+    """List a directory from the filesystem, sorted by name."""
+    if scandir_bulk is not None:
+        return sorted(scandir_bulk(path), key=_entry_name)
+
+    with os.scandir(path) as entries:
+        return sorted(entries, key=_entry_name)
+
+
+def _readable_children(children: List['DirectoryNode']) -> List['DirectoryNode']:
+    """Drop child directories that could not be read (left with ``children`` None)."""
+    return [child for child in children if child.type == 'file' or child.children is not None]
+
+
+def _stat_files(entries: List[os.DirEntry]):
+    """Fill the cached stat of each non-directory entry."""
+    for entry in entries:
+        try:
+            if not entry.is_dir():
+                entry.stat()
+        except OSError:
+            pass
+
+
+class CachedDirEntry:
+    """Directory entry restored from the listing cache, mimicking ``os.DirEntry``."""
+
+    __slots__ = ('name', 'path', '_is_dir', '_is_file', '_is_symlink', '_stat')
+
+    def __init__(self, name: str, path: str, is_dir: bool, is_file: bool, size: int, is_symlink: bool):
+        self.name = name
+        self.path = path
+        self._is_dir = is_dir
+        self._is_file = is_file
+        self._is_symlink = is_symlink
+        mode = stat.S_IFDIR if is_dir else stat.S_IFREG
+        # Only st_mode and st_size are meaningful
+        self._stat = os.stat_result((mode, 0, 0, 0, 0, 0, size, 0, 0, 0))
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"<CachedDirEntry {self.name!r}>"
+
+    def is_dir(self) -> bool:
+        return self._is_dir
+
+    def is_file(self) -> bool:
+        return self._is_file
+
+    def is_symlink(self) -> bool:
+        return self._is_symlink
+
+    def stat(self) -> os.stat_result:
+        return self._stat
+
+
+class ListingCache:
+    """
+    Directory listings persisted in SQLite and reused while a directory is unchanged.
+
+    A listing is served from the cache while the directory's mtime and ctime
+    still match and it is younger than the TTL. Adding, removing or renaming
+    entries changes the directory mtime, but rewriting a file in place does
+    not, so the TTL bounds how stale a cached file size can get. Each stored
+    listing is committed right away, so other processes sharing the file only
+    wait on single writes. Expired rows are purged when the cache is closed
+    (at interpreter exit at the latest).
+    """
+
+    DEFAULT_PATH = Path.home() / ".cache" / "organize-media" / "tree_cache.db"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, ttl_seconds: float = 300):
+        """
+        Initialize the listing cache.
+
+        Args:
+            path: SQLite file backing the cache (defaults to ~/.cache/organize-media/tree_cache.db)
+            ttl_seconds: How long a stored listing stays valid
+        """
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.ttl_seconds = ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._unavailable = False
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def get(self, directory: str, stamp: str) -> Optional[List[CachedDirEntry]]:
+        """Return the cached listing of a directory, or None if missing, changed or expired."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT entries FROM listings WHERE path = ? AND stamp = ? AND created > ?",
+                    (directory, stamp, time.time() - self.ttl_seconds)
+                ).fetchone()
+            except sqlite3.Error:
+                # e.g. locked by another run; fall back to reading the directory
+                return None
+
+        if row is None:
+            return None
+
+        return [CachedDirEntry(name, os.path.join(directory, name), is_dir, is_file, size, is_symlink)
+                for name, is_dir, is_file, size, is_symlink in json.loads(row[0])]
+
+    def set(self, directory: str, stamp: str, entries: List[CachedDirEntry]):
+        """Store the listing of a directory under its current stamp."""
+        payload = json.dumps([[entry.name, entry.is_dir(), entry.is_file(), entry.stat().st_size,
+                               entry.is_symlink()]
+                              for entry in entries])
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO listings (path, stamp, created, entries) VALUES (?, ?, ?, ?)",
+                    (directory, stamp, time.time(), payload)
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def scandir(self, directory: Union[str, Path]) -> List[CachedDirEntry]:
+        """
+        List a directory, serving the stored listing while the directory is unchanged.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Entries of the directory, sorted by name
+
+        Raises:
+            OSError: If the directory cannot be stat'ed or read
+        """
+        directory = os.fspath(directory)
+        dir_stat = os.stat(directory)
+        stamp = f"{dir_stat.st_mtime_ns}:{dir_stat.st_ctime_ns}"
+        entries = self.get(directory, stamp)
+        if entries is None:
+            entries = [self.from_entry(entry) for entry in _read_directory(directory)]
+            self.set(directory, stamp, entries)
+        return entries
+
+    def clear(self):
+        """Drop every stored listing."""
+        with self._lock:
+            conn = self._connect()
+            if conn is not None:
+                try:
+                    conn.execute("DELETE FROM listings")
+                    conn.commit()
+                except sqlite3.Error:
+                    pass
+
+    def close(self):
+        """Purge expired listings, commit and close the database."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute("DELETE FROM listings WHERE created <= ?", (time.time() - self.ttl_seconds,))
+                self._conn.commit()
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use; an unusable location disables the cache."""
+        if self._conn is None and not self._unavailable:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # Shared by the tree walk's worker threads, serialized by self._lock. A
+                # short timeout keeps a busy database from stalling the walk; the
+                # listing is read from disk instead
+                conn = sqlite3.connect(str(self.path), timeout=0.5, check_same_thread=False)
+                # Losing recent rows in a crash only costs a re-read, so skip the fsyncs
+                conn.execute("PRAGMA synchronous=OFF")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS listings "
+                    "(path TEXT PRIMARY KEY, stamp TEXT NOT NULL, created REAL NOT NULL, entries TEXT NOT NULL)"
+                )
+                self._conn = conn
+            except (OSError, sqlite3.Error):
+                self._unavailable = True
+
+        return self._conn
+
+    @staticmethod
+    def from_entry(entry: os.DirEntry) -> CachedDirEntry:
+        """Snapshot a live directory entry, reading its type and size."""
+        try:
+            is_symlink = entry.is_symlink()
+            is_dir = entry.is_dir()
+            is_file = not is_dir and entry.is_file()
+            size = entry.stat().st_size if is_file else 0
+        except OSError:
+            is_symlink = is_dir = is_file = False
+            size = 0
+        return CachedDirEntry(entry.name, entry.path, is_dir, is_file, size, is_symlink)
+
+
 class TreeGenerator:
     """Generates directory trees for media organization."""
 
@@ -42,24 +295,119 @@ class TreeGenerator:
     SUBTITLE_EXTENSIONS = {'.srt', '.sub', '.idx', '.ass', '.ssa', '.vtt'}
     EXTRA_EXTENSIONS = {'.nfo', '.jpg', '.jpeg', '.png', '.gif', '.txt', '.md'}
 
-    def __init__(self, root_path: Union[str, Path]):
-        """Initialize with root directory path."""
+    # Extension -> 'video' / 'subtitle' / 'extra', so each file needs a single lookup
+    _EXT_KIND = {
+        **{ext: 'video' for ext in VIDEO_EXTENSIONS},
+        **{ext: 'subtitle' for ext in SUBTITLE_EXTENSIONS},
+        **{ext: 'extra' for ext in EXTRA_EXTENSIONS},
+    }
+
+    # Season markers ("S01", "Season 2", "season.03") and quality tags in filenames
+    _TOKEN_RE = re.compile(
+        r's(?P<season>\d{2})(?!\d)'
+        r'|season[ .](?P<season_word>\d{1,2})(?!\d)'
+        r'|(?P<quality>1080p|2160p|4k|720p)',
+        re.IGNORECASE
+    )
+    _QUALITY_LABELS = {'1080p': '1080p', '2160p': '2160p/4K', '4k': '2160p/4K', '720p': '720p'}
+
+    # Files stat'ed per task when a large root listing is stat'ed concurrently
+    STAT_BATCH_SIZE = 64
+
+    def __init__(self, root_path: Union[str, Path], listing_cache: Optional[ListingCache] = None):
+        """
+        Initialize with root directory path.
+
+        Args:
+            root_path: Directory to scan
+            listing_cache: Optional cache of directory listings shared across scans and runs
+        """
         self.root_path = Path(root_path)
         if not self.root_path.exists():
             raise ValueError(f"Path does not exist: {root_path}")
 
-    def generate_tree(self, max_depth: int = 5, include_hidden: bool = False) -> DirectoryNode:
+        self.listing_cache = listing_cache
+
+        # Root listing handed over by from_scandir, consumed by the first scan
+        self._root_entries: Optional[List[os.DirEntry]] = None
+
+    @classmethod
+    def from_scandir(cls, entries: Iterator[os.DirEntry], root: Union[str, Path]) -> 'TreeGenerator':
+        """
+        Create a generator from an already-open ``os.scandir`` iterator of the root.
+
+        Opening the directory already proves it exists, so the separate existence
+        check is skipped and the listed entries are reused by the first scan of
+        the root instead of reading the directory again.
+
+        Args:
+            entries: Iterator returned by ``os.scandir(root)``; it is consumed and closed
+            root: Path of the directory the iterator was opened on
+
+        Returns:
+            TreeGenerator rooted at ``root``
+        """
+        generator = cls.__new__(cls)
+        generator.root_path = Path(root)
+        generator.listing_cache = None
+        with entries:
+            generator._root_entries = sorted(entries, key=_entry_name)
+        return generator
+
+    def clear_cache(self):
+        """Forget all cached directory listings."""
+        if self.listing_cache is not None:
+            self.listing_cache.clear()
+
+    def _list_directory(self, path: Union[str, Path]) -> List[os.DirEntry]:
+        """Return the sorted entries of a directory, reusing the handed-over root listing or the listing cache."""
+        if self._root_entries is not None and os.fspath(path) == os.fspath(self.root_path):
+            children, self._root_entries = self._root_entries, None
+            return children
+
+        if self.listing_cache is None:
+            return _read_directory(path)
+
+        return self.listing_cache.scandir(path)
+
+    def generate_tree(self, max_depth: int = 5, include_hidden: bool = False,
+                      max_workers: Optional[int] = None) -> DirectoryNode:
         """
         Generate a complete directory tree structure.
 
         Args:
             max_depth: Maximum depth to traverse
             include_hidden: Whether to include hidden files/directories
+            max_workers: Threads used to walk top-level folders concurrently (1 walks sequentially)
 
         Returns:
             DirectoryNode representing the root of the tree
         """
-        return self._build_tree_node(self.root_path, 0, max_depth, include_hidden)
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        return self._build_tree_node(self.root_path, 0, max_depth, include_hidden, max_workers)
+
+    def generate_tree_with_analysis(self, max_depth: int = 5, include_hidden: bool = False,
+                                    max_workers: Optional[int] = None) -> Tuple[Optional[DirectoryNode], Dict]:
+        """
+        Generate the directory tree and analyze its media content in the same walk.
+
+        Equivalent to ``generate_tree`` followed by ``analyze_media_content`` on
+        the result, without a second pass over the finished tree.
+
+        Args:
+            max_depth: Maximum depth to traverse
+            include_hidden: Whether to include hidden files/directories
+            max_workers: Threads used to walk top-level folders concurrently (1 walks sequentially)
+
+        Returns:
+            Tuple of the root DirectoryNode and the analysis dictionary
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        analysis = self._new_analysis()
+        tree = self._build_tree_node(self.root_path, 0, max_depth, include_hidden, max_workers, analysis)
+        return tree, self._finish_analysis(analysis)
 
     def generate_single_folder_tree(self, folder_name: str, max_depth: int = 3) -> Optional[DirectoryNode]:
         """
@@ -73,59 +421,162 @@ class TreeGenerator:
             DirectoryNode for the specified folder or None if not found
         """
         folder_path = self.root_path / folder_name
-        if not folder_path.exists() or not folder_path.is_dir():
+        if not os.path.isdir(folder_path):
             return None
 
         return self._build_tree_node(folder_path, 0, max_depth, False)
 
-    def _build_tree_node(self, path: Path, current_depth: int, max_depth: int, include_hidden: bool) -> DirectoryNode:
-        """Build a tree node recursively."""
-        if current_depth > max_depth:
-            return None
+    def _build_tree_node(self, entry: Union[Path, os.DirEntry], current_depth: int, max_depth: int,
+                         include_hidden: bool, max_workers: int = 1,
+                         analysis: Optional[Dict] = None) -> Optional[DirectoryNode]:
+        """
+        Build the tree below a starting entry.
+
+        Children are handled as the ``os.DirEntry`` objects produced while
+        listing their parent, so type checks and sizes come from the directory
+        read instead of extra stat calls. Only the starting path is a ``Path``.
+        With more than one worker, each subdirectory of the starting directory
+        is walked on its own thread. When ``analysis`` is given, every file
+        node is counted into it as it is created.
+        """
+        root = self._create_node(entry, current_depth, max_depth, include_hidden, analysis)
+        if root is None or root.type == 'file':
+            return root
+
+        if max_workers > 1:
+            def walk(subdir):
+                # Each worker counts into its own dictionary, merged below
+                partial = self._new_analysis() if analysis is not None else None
+                self._walk_directory(subdir, current_depth + 1, max_depth, include_hidden, partial)
+                return partial
+
+            # Listing and stat release the GIL, so on network mounts and
+            # spinning disks the per-folder walks overlap their waits
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                subdirs = self._expand_directory(root, current_depth, max_depth, include_hidden, analysis, executor)
+                if subdirs:
+                    for partial in executor.map(walk, subdirs):
+                        if partial is not None:
+                            self._merge_analysis(analysis, partial)
+                    root.children = _readable_children(root.children)
+        else:
+            self._walk_directory(root, current_depth, max_depth, include_hidden, analysis)
+
+        return root if root.children is not None else None
+
+    def _walk_directory(self, top: DirectoryNode, depth: int, max_depth: int, include_hidden: bool,
+                        analysis: Optional[Dict] = None) -> None:
+        """
+        Fill in the children of a directory node and everything below it.
 
-        # Skip hidden files/directories if not included
-        if not include_hidden and path.name.startswith('.'):
-            return None
+        Directories are walked with an explicit stack instead of one Python call
+        per directory, so deep libraries cannot hit the recursion limit. A
+        directory that cannot be read keeps ``children`` as None.
+        """
+        # (node, depth, children_done); a node is revisited once its children
+        # are walked to drop subdirectories that could not be read
+        stack = [(top, depth, False)]
+        while stack:
+            node, depth, children_done = stack.pop()
+            if children_done:
+                node.children = _readable_children(node.children)
+                continue
+
+            subdirs = self._expand_directory(node, depth, max_depth, include_hidden, analysis)
+            if subdirs:
+                stack.append((node, depth, True))
+                stack.extend((child, depth + 1, False) for child in subdirs)
+
+    def _expand_directory(self, node: DirectoryNode, depth: int, max_depth: int, include_hidden: bool,
+                          analysis: Optional[Dict] = None,
+                          executor: Optional[ThreadPoolExecutor] = None) -> Optional[List[DirectoryNode]]:
+        """
+        List one directory into ``node.children``.
 
-        node = DirectoryNode(
-            name=path.name,
-            path=str(path),
-            type='directory' if path.is_dir() else 'file'
-        )
+        Args:
+            analysis: Analysis dictionary to count the new file nodes into
+            executor: Pool used to stat the files of large directories concurrently
 
-        if path.is_file():
-            # Handle file
-            node.size = path.stat().st_size
-            node.media_file = self._create_media_file(path)
-            return node
+        Returns:
+            The child directory nodes still to be walked, or None if the
+            directory could not be read
+        """
+        if depth >= max_depth:
+            # Nothing below this depth is kept, so don't list it
+            node.children = []
+            return []
 
-        # Handle directory
         try:
-            children = []
-            for child_path in sorted(path.iterdir()):
-                child_node = self._build_tree_node(child_path, current_depth + 1, max_depth, include_hidden)
-                if child_node:
-                    children.append(child_node)
+            entries = self._list_directory(node.path)
+        except PermissionError:
+            # Skip directories we can't read; children stays None
+            return None
 
-            node.children = children
-            return node
+        if executor is not None and len(entries) > self.STAT_BATCH_SIZE:
+            # Each DirEntry caches its stat, so warming them in batches lets the
+            # per-file stats of a big flat folder overlap instead of queueing
+            batches = [entries[i:i + self.STAT_BATCH_SIZE]
+                       for i in range(0, len(entries), self.STAT_BATCH_SIZE)]
+            list(executor.map(_stat_files, batches))
+
+        children = []
+        subdirs = []
+        for child_entry in entries:
+            child = self._create_node(child_entry, depth + 1, max_depth, include_hidden, analysis)
+            if child is None:
+                continue
+            children.append(child)
+            if child.type == 'directory':
+                subdirs.append(child)
+
+        node.children = children
+        return subdirs
+
+    def _create_node(self, entry: Union[Path, os.DirEntry], depth: int, max_depth: int,
+                     include_hidden: bool, analysis: Optional[Dict] = None) -> Optional[DirectoryNode]:
+        """Create the node for one entry, leaving directory children to the caller."""
+        if depth > max_depth:
+            return None
 
-        except PermissionError:
-            # Skip directories we can't read
+        # Skip hidden files/directories if not included
+        if not include_hidden and entry.name.startswith('.'):
             return None
 
-    def _create_media_file(self, path: Path) -> MediaFile:
-        """Create a MediaFile object from a file path."""
-        extension = path.suffix.lower()
+        is_dir = entry.is_dir()
+        node = DirectoryNode(
+            name=entry.name,
+            path=os.fspath(entry),
+            type='directory' if is_dir else 'file'
+        )
+
+        if not is_dir:
+            if not entry.is_file():
+                # Broken symlinks, sockets and the like
+                return None
+            stat_result = entry.stat()
+            node.size = stat_result.st_size
+            node.media_file = self._create_media_file(entry, stat_result)
+            if analysis is not None:
+                self._analyze_file(node, analysis)
+
+        return node
+
+    def _create_media_file(self, entry: Union[Path, os.DirEntry], stat_result: os.stat_result) -> MediaFile:
+        """Create a MediaFile object from a directory entry and its already-read stat."""
+        name = entry.name
+        # Same result as os.path.splitext: dots leading the name don't start an extension
+        head, _, tail = name.rpartition('.')
+        extension = '.' + tail.lower() if head.strip('.') else ''
+        kind = self._EXT_KIND.get(extension)
 
         return MediaFile(
-            name=path.name,
-            path=str(path),
-            size=path.stat().st_size,
+            name=name,
+            path=os.fspath(entry),
+            size=stat_result.st_size,
             extension=extension,
-            is_video=extension in self.VIDEO_EXTENSIONS,
-            is_subtitle=extension in self.SUBTITLE_EXTENSIONS,
-            is_extra=extension in self.EXTRA_EXTENSIONS
+            is_video=kind == 'video',
+            is_subtitle=kind == 'subtitle',
+            is_extra=kind == 'extra'
         )
 
     def tree_to_text(self, node: DirectoryNode, prefix: str = "", is_last: bool = True) -> str:
@@ -140,28 +591,149 @@ class TreeGenerator:
         Returns:
             String representation of the tree
         """
-        if not node:
-            return ""
+        if node and not prefix and is_last and node.children is not None and _is_shallow(node):
+            return self._shallow_tree_to_text(node)
+        return "".join(self.iter_tree_lines(node, prefix, is_last))
 
-        # Current node line
-        current_prefix = "└── " if is_last else "├── "
-        result = f"{prefix}{current_prefix}{node.name}"
+    @staticmethod
+    def _shallow_tree_to_text(node: DirectoryNode) -> str:
+        """
+        Render a tree at most two levels deep, such as show/season/episode.
 
-        # Add file size for files
-        if node.type == 'file' and node.size:
-            size_mb = node.size / (1024 * 1024)
-            result += f" ({size_mb:.1f} MB)"
+        The connectors of every level are fixed, so each level is a plain loop
+        with no stack and the episode lines are built in a single comprehension.
+        """
+        lines = [_tree_line("└── ", node)]
+        children = node.children
+        last_index = len(children) - 1
+        for i, child in enumerate(children):
+            if i == last_index:
+                lines.append(_tree_line("    └── ", child))
+                child_prefix = "        "
+            else:
+                lines.append(_tree_line("    ├── ", child))
+                child_prefix = "    │   "
+
+            grandchildren = child.children
+            if grandchildren:
+                middle = child_prefix + "├── "
+                lines.extend([_tree_line(middle, grandchild) for grandchild in grandchildren[:-1]])
+                lines.append(_tree_line(child_prefix + "└── ", grandchildren[-1]))
+
+        return "".join(lines)
+
+    def iter_tree_lines(self, node: DirectoryNode, prefix: str = "", is_last: bool = True) -> Iterator[str]:
+        """
+        Yield the lines of the text representation one at a time.
 
-        result += "\n"
+        Lets callers stream or truncate large trees without building the whole
+        string first. Each yielded line ends with a newline.
 
-        # Process children
-        if node.children:
-            next_prefix = prefix + ("    " if is_last else "│   ")
-            for i, child in enumerate(node.children):
-                is_child_last = (i == len(node.children) - 1)
-                result += self.tree_to_text(child, next_prefix, is_child_last)
+        Args:
+            node: The root node to convert
+            prefix: Current line prefix for formatting
+            is_last: Whether this is the last child at current level
+        """
+        # Walk the tree with an explicit stack; nested ``yield from`` would pass
+        # every line back up through one generator frame per tree level
+        stack = [(node, prefix, is_last)]
+        while stack:
+            node, prefix, is_last = stack.pop()
+            if not node:
+                continue
+
+            # Current node line, formatted in one step (with the size for files);
+            # same as _tree_line, inlined since this loop renders whole trees
+            current_prefix = "└── " if is_last else "├── "
+            if node.type == 'file' and node.size:
+                yield f"{prefix}{current_prefix}{node.name} ({node.size / _BYTES_PER_MB:.1f} MB)\n"
+            else:
+                yield f"{prefix}{current_prefix}{node.name}\n"
+
+            # Queue children in reverse so they pop in order
+            if node.children:
+                next_prefix = prefix + ("    " if is_last else "│   ")
+                last_index = len(node.children) - 1
+                for i in range(last_index, -1, -1):
+                    stack.append((node.children[i], next_prefix, i == last_index))
+
+    def iter_directory_lines(self, max_depth: int = 5, include_hidden: bool = False,
+                             analysis: Optional[Dict] = None) -> Iterator[str]:
+        """
+        Yield the text representation of the directory tree while walking it.
 
-        return result
+        Produces the same lines as ``tree_to_text(generate_tree(...))`` without
+        building the whole tree. For each directory on the current path the walk
+        holds the nodes of its children, not yet drawn ones included, plus the
+        listings of those child directories (read ahead to know which sibling
+        is drawn last). Subtrees already drawn are dropped, so memory grows with
+        depth and folder width rather than library size, and the first lines are
+        available as soon as the root's children have been listed.
+
+        Args:
+            max_depth: Maximum depth to traverse
+            include_hidden: Whether to include hidden files/directories
+            analysis: Optional dictionary that is filled with the
+                ``analyze_media_content`` results once every line has been yielded
+        """
+        counts = self._new_analysis() if analysis is not None else None
+        root = self._create_node(self.root_path, 0, max_depth, include_hidden, counts)
+        children = []
+        if root is not None and root.type == 'directory':
+            try:
+                listing = self._list_directory(root.path) if max_depth > 0 else []
+            except PermissionError:
+                root = None
+            else:
+                children = self._listed_children(listing, 1, max_depth, include_hidden, counts)
+
+        if root is not None:
+            yield _tree_line("└── ", root)
+
+        # [children, next index, prefix, depth of the children]
+        stack = [[children, 0, "    ", 1]]
+        while stack:
+            frame = stack[-1]
+            children, index, prefix, depth = frame
+            if index == len(children):
+                stack.pop()
+                continue
+
+            frame[1] = index = index + 1
+            node, listing = children[index - 1]
+            is_last = index == len(children)
+            yield _tree_line(prefix + ("└── " if is_last else "├── "), node)
+
+            if listing:
+                stack.append([self._listed_children(listing, depth + 1, max_depth, include_hidden, counts),
+                              0, prefix + ("    " if is_last else "│   "), depth + 1])
+
+        if analysis is not None:
+            analysis.update(self._finish_analysis(counts))
+
+    def _listed_children(self, entries: List[os.DirEntry], depth: int, max_depth: int, include_hidden: bool,
+                         analysis: Optional[Dict]) -> List[Tuple[DirectoryNode, Optional[List[os.DirEntry]]]]:
+        """
+        Create the nodes for a directory listing, pairing each subdirectory with its own listing.
+
+        Subdirectories are listed up front because one that cannot be read is
+        left out, which changes which of its siblings is drawn last.
+        """
+        children = []
+        for entry in entries:
+            child = self._create_node(entry, depth, max_depth, include_hidden, analysis)
+            if child is None:
+                continue
+
+            listing = None
+            if child.type == 'directory' and depth < max_depth:
+                try:
+                    listing = self._list_directory(child.path)
+                except PermissionError:
+                    continue
+            children.append((child, listing))
+
+        return children
 
     def tree_to_json(self, node: DirectoryNode) -> Dict:
         """Convert tree structure to JSON format."""
@@ -192,15 +764,14 @@ class TreeGenerator:
 
     def get_folder_list(self) -> List[str]:
         """Get list of all folders in the root directory."""
-        folders = []
         try:
-            for item in self.root_path.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    folders.append(item.name)
+            entries = self._list_directory(self.root_path)
         except PermissionError:
-            pass
+            return []
 
-        return sorted(folders)
+        # The listing is already sorted by name; the cheap hidden-name test runs
+        # before is_dir, which may need a stat for symlinks
+        return [entry.name for entry in entries if not entry.name.startswith('.') and entry.is_dir()]
 
     def analyze_media_content(self, node: DirectoryNode) -> Dict:
         """
@@ -209,7 +780,32 @@ class TreeGenerator:
         Returns:
             Dictionary with analysis results including file counts, sizes, etc.
         """
-        analysis = {
+        analysis = self._new_analysis()
+
+        # Gather the file nodes into flat lists first, then reduce each column with
+        # builtins (len/sum run their loops in C) instead of updating the counters
+        # one file at a time
+        media = [file_node for file_node in self._iter_file_nodes(node) if file_node.media_file]
+        videos = [file_node for file_node in media if file_node.media_file.is_video]
+
+        analysis["total_files"] = len(media)
+        analysis["total_size"] = sum([file_node.size or 0 for file_node in media])
+        analysis["video_files"] = len(videos)
+        analysis["video_size"] = sum([file_node.size or 0 for file_node in videos])
+        analysis["subtitle_files"] = sum([file_node.media_file.is_subtitle for file_node in media])
+        analysis["extra_files"] = sum([file_node.media_file.is_extra for file_node in media])
+
+        find_tokens = self._TOKEN_RE.findall
+        analysis["_tokens"].update(
+            chain.from_iterable(find_tokens(file_node.media_file.name) for file_node in videos)
+        )
+
+        return self._finish_analysis(analysis)
+
+    @staticmethod
+    def _new_analysis() -> Dict:
+        """Return an empty analysis dictionary to count files into."""
+        return {
             "total_files": 0,
             "video_files": 0,
             "subtitle_files": 0,
@@ -218,62 +814,72 @@ class TreeGenerator:
             "video_size": 0,
             "seasons_detected": set(),
             "episodes_detected": [],
-            "quality_formats": set()
+            "quality_formats": set(),
+            # Raw _TOKEN_RE matches; season and quality tokens repeat across
+            # episodes, so only the distinct ones are converted, when finishing
+            "_tokens": set()
         }
 
-        self._analyze_node_recursive(node, analysis)
-
-        # Convert sets to lists for JSON serialization
+    @staticmethod
+    def _merge_analysis(analysis: Dict, other: Dict):
+        """Add the counts of one unfinished analysis dictionary into another."""
+        for key, value in other.items():
+            if isinstance(value, set):
+                analysis[key] |= value
+            else:
+                analysis[key] += value
+
+    @classmethod
+    def _finish_analysis(cls, analysis: Dict) -> Dict:
+        """Resolve the collected tokens and convert sets to lists for JSON serialization."""
+        cls._record_tokens(analysis.pop("_tokens"), analysis)
         analysis["seasons_detected"] = sorted(list(analysis["seasons_detected"]))
         analysis["quality_formats"] = sorted(list(analysis["quality_formats"]))
-
         return analysis
 
-    def _analyze_node_recursive(self, node: DirectoryNode, analysis: Dict):
-        """Recursively analyze a node and update analysis dictionary."""
-        if not node:
-            return
-
-        if node.type == 'file' and node.media_file:
-            analysis["total_files"] += 1
-            analysis["total_size"] += node.size or 0
-
-            if node.media_file.is_video:
-                analysis["video_files"] += 1
-                analysis["video_size"] += node.size or 0
-
-                # Detect season/episode patterns
-                filename = node.media_file.name.lower()
-                if 's01' in filename or 'season 01' in filename or 'season.01' in filename:
-                    analysis["seasons_detected"].add("Season 01")
-                if 's02' in filename or 'season 02' in filename or 'season.02' in filename:
-                    analysis["seasons_detected"].add("Season 02")
-                if 's03' in filename or 'season 03' in filename or 'season.03' in filename:
-                    analysis["seasons_detected"].add("Season 03")
-
-                # Detect quality formats
-                if '1080p' in filename:
-                    analysis["quality_formats"].add("1080p")
-                if '2160p' in filename or '4k' in filename:
-                    analysis["quality_formats"].add("2160p/4K")
-                if '720p' in filename:
-                    analysis["quality_formats"].add("720p")
-
-            elif node.media_file.is_subtitle:
-                analysis["subtitle_files"] += 1
-            elif node.media_file.is_extra:
-                analysis["extra_files"] += 1
-
-        # Process children
-        if node.children:
-            for child in node.children:
-                self._analyze_node_recursive(child, analysis)
+    @staticmethod
+    def _iter_file_nodes(node: DirectoryNode) -> Iterator[DirectoryNode]:
+        """Yield every file node of a tree, walking it with an explicit stack."""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if not node:
+                continue
+            if node.type == 'file':
+                yield node
+            if node.children:
+                stack.extend(node.children)
+
+    def _analyze_file(self, node: DirectoryNode, analysis: Dict):
+        """Count one file node into the analysis dictionary."""
+        analysis["total_files"] += 1
+        analysis["total_size"] += node.size or 0
+
+        if node.media_file.is_video:
+            analysis["video_files"] += 1
+            analysis["video_size"] += node.size or 0
+
+            # Matching and collecting both run in C; tokens are resolved once at the end
+            analysis["_tokens"].update(self._TOKEN_RE.findall(node.media_file.name))
+
+        elif node.media_file.is_subtitle:
+            analysis["subtitle_files"] += 1
+        elif node.media_file.is_extra:
+            analysis["extra_files"] += 1
+
+    @classmethod
+    def _record_tokens(cls, tokens: Iterable[Tuple[str, str, str]], analysis: Dict):
+        """Record season markers and quality formats from ``_TOKEN_RE.findall`` matches."""
+        for season, season_word, quality in tokens:
+            season = season or season_word
+            if season:
+                analysis["seasons_detected"].add(f"Season {int(season):02d}")
+            else:
+                analysis["quality_formats"].add(cls._QUALITY_LABELS[quality.lower()])
 
 
 def main():
     """Example usage of TreeGenerator."""
-    import sys
-
     if len(sys.argv) != 2:
         print("Usage: python tree_generator.py <directory_path>")
         sys.exit(1)
@@ -285,7 +891,7 @@ def main():
 
         # Generate tree for entire directory
         print("Generating directory tree...")
-        tree = generator.generate_tree(max_depth=3)
+        tree, analysis = generator.generate_tree_with_analysis(max_depth=3)
 
         # Print text representation
         print("\nDirectory Tree:")
@@ -293,7 +899,6 @@ def main():
 
         # Print analysis
         print("\nMedia Analysis:")
-        analysis = generator.analyze_media_content(tree)
         for key, value in analysis.items():
             print(f"  {key}: {value}")
 